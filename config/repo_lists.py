@@ -1,7 +1,10 @@
 """Predefined repository lists for different AI/ML domains."""
 
+from types import MappingProxyType
+from typing import Mapping
+
 # Popular LLM repositories
-LLM_REPOS = [
+LLM_REPOS = (
     "huggingface/transformers",
     "openai/openai-python",
     "microsoft/DeepSpeed",
@@ -12,10 +15,10 @@ LLM_REPOS = [
     "EleutherAI/gpt-neox",
     "bigscience-workshop/Megatron-DeepSpeed",
     "huggingface/tokenizers",
-]
+)
 
 # Generative AI and tools
-GENAI_REPOS = [
+GENAI_REPOS = (
     "langchain-ai/langchain",
     "run-llama/llama_index",
     "openai/gym",
@@ -26,10 +29,10 @@ GENAI_REPOS = [
     "jerryjliu/llama_index",
     "guidance-ai/guidance",
     "microsoft/autogen",
-]
+)
 
 # LLMOps and deployment
-LLMOPS_REPOS = [
+LLMOPS_REPOS = (
     "bentoml/BentoML",
     "ray-project/ray",
     "mlflow/mlflow",
@@ -40,10 +43,10 @@ LLMOPS_REPOS = [
     "kubeflow/kubeflow",
     "seldon-io/seldon-core",
     "onnx/onnx",
-]
+)
 
 # Machine Learning frameworks
-ML_REPOS = [
+ML_REPOS = (
     "pytorch/pytorch",
     "tensorflow/tensorflow",
     "scikit-learn/scikit-learn",
@@ -54,10 +57,10 @@ ML_REPOS = [
     "catboost/catboost",
     "microsoft/LightGBM",
     "apache/spark",
-]
+)
 
 # Natural Language Processing
-NLP_REPOS = [
+NLP_REPOS = (
     "explosion/spaCy",
     "nltk/nltk",
     "RaRe-Technologies/gensim",
@@ -68,23 +71,20 @@ NLP_REPOS = [
     "google-research/language",
     "UKPLab/sentence-transformers",
     "deepset-ai/haystack",
-]
+)
 
 # All predefined lists
-REPO_LISTS = {
-    "llm": LLM_REPOS,
-    "genai": GENAI_REPOS,
-    "llmops": LLMOPS_REPOS,
-    "ml": ML_REPOS,
-    "nlp": NLP_REPOS,
-}
-
-
-def get_repo_list(name: str) -> list[str]:
-    """Get a predefined repository list by name."""
-    return REPO_LISTS.get(name.lower(), [])
+REPO_LISTS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "llm": LLM_REPOS,
+        "genai": GENAI_REPOS,
+        "llmops": LLMOPS_REPOS,
+        "ml": ML_REPOS,
+        "nlp": NLP_REPOS,
+    }
+)
 
 
-def list_available_repo_lists() -> list[str]:
-    """Get names of all available predefined repository lists."""
-    return list(REPO_LISTS.keys())
+def get_repo_list(name: str) -> tuple[str, ...]:
+    """Get a predefined repository list by name (empty if unknown)."""
+    return REPO_LISTS.get(name.lower(), ())
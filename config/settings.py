@@ -2,15 +2,11 @@
 
 from pathlib import Path
 
-# Project paths
-PROJECT_ROOT = Path(__file__).parent.parent
+# Project paths (nothing is created at import)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
-
 # GitHub API settings
 GITHUB_API_BASE_URL = "https://api.github.com"
 RATE_LIMIT_BUFFER = 100  # Keep this many requests in reserve
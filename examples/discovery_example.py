@@ -63,7 +63,7 @@ def main():
 
         if issues:
             print("\nTop issues:")
-            for i, issue in enumerate(issues[:3], 1):
+            for i, issue in enumerate(issue_discoverer.get_top_issues(limit=3), 1):
                 print(f"  {i}. #{issue.number}: {issue.title[:50]}...")
                 print(f"     Labels: {', '.join(issue.labels[:3])}")
                 print(f"     Priority: {issue.priority_score:.2f}")
@@ -0,0 +1,537 @@
+"""
+RepoRadio command-line interface.
+
+Discover GitHub issues and generate audio summaries for listening on-the-go.
+"""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from datetime import datetime
+
+# Load environment variables
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import click
+import orjson
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+# Add the project's config directory to path for the predefined repo lists
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "config"))
+
+try:
+    from repo_lists import get_repo_list  # type: ignore
+except ImportError:
+    # Config not available (e.g. installed without the source tree)
+    def get_repo_list(name: str) -> tuple[str, ...]:
+        return ()
+
+
+console = Console()
+
+# Phase status goes to Rich on a terminal; piped/CI runs get one JSON line
+INTERACTIVE = sys.stdout.isatty()
+_events: list[dict] = []
+
+
+def log_event(event: str, message: str, **fields) -> None:
+    """Report a phase transition as a styled line or a buffered JSON event."""
+    if INTERACTIVE:
+        console.print(message)
+    else:
+        _events.append({"event": event, **fields})
+
+
+def flush_events() -> None:
+    """Write buffered phase events as a single JSON line."""
+    if _events:
+        sys.stdout.write(orjson.dumps({"events": _events}).decode() + "\n")
+        sys.stdout.flush()
+        _events.clear()
+
+
+# Seconds a topic-discovery result set is reused between runs
+DISCOVERY_CACHE_TTL = 300
+
+
+def _discovery_cache_key(
+    categories: list[str], min_stars: int, max_stars: int, max_repos: int
+) -> str:
+    """Stable cache key for a discovery query."""
+    raw = f"{sorted(categories)}|{min_stars}|{max_stars}|{max_repos}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@click.command()
+@click.option(
+    "--repos",
+    "-r",
+    help="Comma-separated list of repositories to check (e.g., 'owner/repo1,owner/repo2') OR predefined list name (llm,genai,llmops,ml,nlp)",
+    type=str,
+)
+@click.option(
+    "--categories",
+    "-c",
+    help="Categories to discover (llm,genai,llmops,ml,nlp)",
+    default="llm,genai",
+    type=str,
+)
+@click.option(
+    "--min-stars",
+    help="Minimum stars for discovered repositories",
+    default=10,
+    type=int,
+)
+@click.option(
+    "--max-stars",
+    help="Maximum stars for discovered repositories",
+    default=5000,
+    type=int,
+)
+@click.option(
+    "--max-repos",
+    help="Maximum repositories to process",
+    default=20,
+    type=int,
+)
+@click.option(
+    "--max-issues-per-repo",
+    help="Maximum issues to fetch per repository",
+    default=5,
+    type=int,
+)
+@click.option(
+    "--output-audio",
+    help="Path to save the audio file",
+    default="issues_summary.wav",
+    type=str,
+)
+@click.option(
+    "--voice",
+    help="TTS voice to use",
+    default="af_bella",
+    type=str,
+)
+@click.option(
+    "--speed",
+    help="TTS speech speed",
+    default=1.15,
+    type=float,
+)
+@click.option(
+    "--skip-tts",
+    help="Generate script only, don't create audio",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--max-workers",
+    help="Maximum parallel workers for repository lookup and issue discovery",
+    default=3,
+    type=int,
+)
+@click.option(
+    "--llm-workers",
+    help="Maximum concurrent LLM assessment requests",
+    default=10,
+    type=int,
+)
+@click.option(
+    "--no-discord",
+    help="Disable Discord notifications",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--no-cache",
+    help="Bypass the on-disk GitHub HTTP and search caches",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--refresh",
+    help="Ignore cached discovery and search results and search GitHub again",
+    is_flag=True,
+    default=False,
+)
+def main(
+    repos: Optional[str],
+    categories: str,
+    min_stars: int,
+    max_stars: int,
+    max_repos: int,
+    max_issues_per_repo: int,
+    output_audio: str,
+    voice: str,
+    speed: float,
+    skip_tts: bool,
+    max_workers: int,
+    llm_workers: int,
+    no_discord: bool,
+    no_cache: bool,
+    refresh: bool,
+):
+    """📻 RepoRadio - GitHub issue discovery with TTS audio summaries."""
+    console.print(
+        Panel.fit(
+            Text("📻 RepoRadio - Audio Summary Generator", style="bold blue"),
+            style="bold",
+        )
+    )
+
+    # Check for GitHub token
+    github_token = os.getenv("GITHUB_TOKEN")
+    if not github_token:
+        console.print(
+            Panel(
+                "[red]Error: GITHUB_TOKEN environment variable not set.\n"
+                "Please set your GitHub personal access token:\n"
+                "[bold cyan]export GITHUB_TOKEN=your_token_here[/bold cyan]",
+                title="⚠️ Missing GitHub Token",
+                style="red",
+            )
+        )
+        return 1
+
+    try:
+        # Deferred so --help and the missing-token path skip these imports
+        from pr_pirate.discovery import (
+            GitHubClient,
+            RepositoryDiscoverer,
+            IssueDiscoverer,
+        )
+        from pr_pirate.models import Repository
+        from pr_pirate.models.issue import BUG_LABELS
+        from pr_pirate.notifications import DiscordNotifier
+        from pr_pirate.utils import DatabaseManager
+
+        # Initialize components
+        log_event("init", "\n[blue]🔧 Initializing components...[/blue]")
+
+        db_manager = DatabaseManager()
+        github_client = GitHubClient(
+            github_token,
+            use_cache=not no_cache,
+            db_manager=db_manager,
+            probe_rate_limits=False,
+            refresh_search_cache=refresh,
+        )
+        repo_discoverer = RepositoryDiscoverer(github_client)
+        issue_discoverer = IssueDiscoverer(github_client)
+        discord_notifier = DiscordNotifier()
+        if no_discord:
+            discord_notifier.enabled = False
+
+        # Test authentication and probe rate limits alongside discovery;
+        # the auth result is checked once repositories are in hand
+        log_event("auth", "\n[blue]🔐 Testing GitHub authentication...[/blue]")
+        startup = ThreadPoolExecutor(max_workers=2)
+        auth_future = startup.submit(github_client.get_authenticated_user)
+        startup.submit(github_client.print_rate_limits)
+        startup.shutdown(wait=False)
+
+        # Choose discovery method
+        if repos:
+            # Check if it's a predefined list name
+            repo_list = get_repo_list(repos)
+            if repo_list:
+                log_event(
+                    "repo_list",
+                    f"\n[blue]📋 Using predefined '{repos}' repository list ({len(repo_list)} repositories)...[/blue]",
+                    name=repos.lower(),
+                    count=len(repo_list),
+                )
+            else:
+                # Parse as comma-separated list
+                repo_list = [repo.strip() for repo in repos.split(",")]
+                log_event(
+                    "repo_list",
+                    f"\n[blue]📋 Processing {len(repo_list)} specified repositories...[/blue]",
+                    count=len(repo_list),
+                )
+
+            # Show first 10 in a single write
+            repo_lines = [f"  • {repo}" for repo in repo_list[:10]]
+            if len(repo_list) > 10:
+                repo_lines.append(f"  ... and {len(repo_list) - 10} more")
+            # Plain output: repository names are data, not markup
+            console.print("\n".join(repo_lines), markup=False, highlight=False)
+
+            repositories = repo_discoverer.get_repositories_by_names(
+                repo_list, max_workers=max_workers
+            )
+        else:
+            # Discovery mode
+            category_list = [cat.strip() for cat in categories.split(",")]
+            log_event(
+                "repo_discovery",
+                f"\n[blue]🔍 Starting repository discovery for categories: {', '.join(category_list)}...[/blue]",
+                categories=category_list,
+            )
+
+            # Reuse recent results for an identical query within the TTL
+            cache_key = _discovery_cache_key(
+                category_list, min_stars, max_stars, max_repos
+            )
+            use_cached = not (refresh or no_cache)
+            cached = db_manager.get_cached_result(cache_key) if use_cached else None
+
+            if cached:
+                repositories = [Repository(**data) for data in orjson.loads(cached)]
+                repo_discoverer.discovered_repos = repositories
+                console.print(
+                    f"[green]✓[/green] Using {len(repositories)} cached repositories (use --refresh to search again)"
+                )
+            else:
+                repositories = repo_discoverer.discover_repositories(
+                    categories=category_list,
+                    min_stars=min_stars,
+                    max_stars=max_stars,
+                    max_repos_per_query=max_repos,
+                    max_workers=max_workers,
+                )
+                if not no_cache:
+                    try:
+                        db_manager.put_cached_result(
+                            cache_key,
+                            orjson.dumps(
+                                [
+                                    repo.model_dump(mode="json", by_alias=True)
+                                    for repo in repositories
+                                ]
+                            ),
+                            ttl=DISCOVERY_CACHE_TTL,
+                        )
+                    except Exception as e:
+                        # Failing to cache must not fail the run
+                        console.print(
+                            f"[yellow]⚠[/yellow] Could not cache discovery results: {e}"
+                        )
+
+        auth_future.result()
+
+        if not repositories:
+            console.print(
+                "[yellow]No repositories found. Try adjusting search criteria or repository list.[/yellow]"
+            )
+            return 0
+
+        # Get top repositories for issue discovery
+        top_repos = repo_discoverer.get_top_repositories(
+            limit=min(len(repositories), 10)
+        )
+        log_event(
+            "top_repos",
+            f"\n[green]✓[/green] Selected top {len(top_repos)} repositories for issue discovery",
+            count=len(top_repos),
+        )
+
+        # Send Discord start notification
+        if discord_notifier.is_enabled():
+            category_list = [cat.strip() for cat in categories.split(",")]
+            discord_notifier.send_start_notification(category_list, len(repositories))
+
+        # Discover issues
+        log_event("issue_discovery", "\n[blue]🎯 Starting issue discovery...[/blue]")
+        issues = issue_discoverer.discover_issues(
+            repositories=top_repos,
+            max_issues_per_repo=max_issues_per_repo,
+            include_unlabeled=False,
+            max_workers=max_workers,
+        )
+
+        if not issues:
+            console.print("[yellow]No suitable issues found.[/yellow]")
+            return 0
+
+        # Show results summary
+        log_event(
+            "discovery_complete",
+            "\n[bold green]🎉 Discovery Complete![/bold green]\n"
+            f"  • Found {len(repositories)} repositories\n"
+            f"  • Found {len(issues)} suitable issues",
+            repositories=len(repositories),
+            issues=len(issues),
+        )
+
+        # Get top 10 issues for assessment
+        top_issues = issue_discoverer.get_top_issues(limit=10)
+        log_event(
+            "assessment",
+            f"\n[blue]🧠 Starting LLM assessment of top {len(top_issues)} issues...[/blue]",
+            count=len(top_issues),
+        )
+
+        # Initialize LLM assessor (LLM SDKs load only on this path)
+        from pr_pirate.llm import IssueAssessor
+
+        try:
+            issue_assessor = IssueAssessor(db_manager=db_manager)
+        except ValueError as e:
+            console.print(f"[red]❌ {e}[/red]")
+            console.print(
+                "[yellow]Skipping LLM assessment and TTS generation.[/yellow]"
+            )
+            return 1
+
+        # Assess issues with LLM
+        assessments = issue_assessor.assess_issues(top_issues, max_workers=llm_workers)
+
+        if not assessments:
+            console.print("[yellow]No issues were successfully assessed.[/yellow]")
+            return 0
+
+        # Send Discord assessment results notification
+        if discord_notifier.is_enabled():
+            discord_notifier.send_assessment_results(top_issues, assessments)
+
+        # Generate audio script
+        log_event("script", "\n[blue]📝 Generating audio script...[/blue]")
+        script = issue_assessor.generate_audio_script(top_issues, assessments)
+
+        # Show script preview
+        issues_data = []
+        assessment_map = {a.issue_id: a for a in assessments}
+
+        for issue in top_issues:
+            if issue.id in assessment_map:
+                assessment = assessment_map[issue.id]
+                is_bug = not BUG_LABELS.isdisjoint(issue.normalized_labels)
+
+                issues_data.append(
+                    {
+                        "repo_name": issue.repo_full_name.split("/")[1],
+                        "issue_type": "Bug" if is_bug else "Feature",
+                        "title": issue.title,
+                        "difficulty": assessment.difficulty,
+                        "composite_score": assessment.composite_score,
+                    }
+                )
+
+        # Render the preview as one table instead of a print per issue
+        preview_table = Table(
+            title=f"📻 Audio Summary Preview ({len(issues_data)} issues)"
+        )
+        preview_table.add_column("#", justify="right", style="cyan")
+        preview_table.add_column("Repository", style="bold")
+        preview_table.add_column("Type", style="green")
+        preview_table.add_column("Title", max_width=50, overflow="ellipsis")
+        preview_table.add_column("Difficulty", style="yellow")
+        preview_table.add_column("Score", justify="right")
+
+        for i, issue_info in enumerate(issues_data, 1):
+            preview_table.add_row(
+                str(i),
+                issue_info["repo_name"],
+                issue_info["issue_type"],
+                Text(issue_info["title"]),
+                issue_info["difficulty"],
+                f"{issue_info['composite_score']:.1f}",
+            )
+
+        console.print()
+        console.print(preview_table)
+
+        if skip_tts:
+            console.print("\n[blue]📄 Script generated (TTS skipped)[/blue]")
+            console.print(f"Script length: {len(script)} characters")
+            return 0
+
+        # Generate audio with TTS
+        log_event("tts", "\n[blue]🎤 Generating audio summary...[/blue]")
+
+        # Load Drive credentials while Replicate renders the audio; the Drive
+        # modules are still only imported once TTS is actually requested
+        from pr_pirate.notifications import GoogleDriveUploader
+
+        drive_setup = ThreadPoolExecutor(max_workers=1)
+        drive_future = drive_setup.submit(GoogleDriveUploader)
+        drive_setup.shutdown(wait=False)
+
+        try:
+            from pr_pirate.tts import ReplicateTTS
+
+            tts = ReplicateTTS()
+            audio_path = tts.generate_audio(
+                text=script, output_path=output_audio, voice=voice, speed=speed
+            )
+
+            log_event(
+                "audio_complete",
+                "\n[bold green]🎉 Audio Summary Complete![/bold green]\n"
+                f"  • Assessed {len(assessments)} issues\n"
+                f"  • Generated script ({len(script)} characters)\n"
+                f"  • Audio saved to: {audio_path}\n"
+                f"  • Voice: {voice}, Speed: {speed}x",
+                assessed=len(assessments),
+                script_length=len(script),
+                audio_path=audio_path,
+                voice=voice,
+                speed=speed,
+            )
+
+            # Upload to Google Drive if enabled
+            google_drive = drive_future.result()
+            drive_link = None
+            if google_drive.is_enabled():
+                drive_link = google_drive.upload_file(
+                    audio_path,
+                    f"RepoRadio audio summary - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                )
+                if drive_link:
+                    console.print(f"  • Google Drive: {drive_link}")
+
+            # Send Discord completion notification
+            if discord_notifier.is_enabled():
+                discord_notifier.send_audio_complete(
+                    audio_path, len(script), voice, speed, drive_link
+                )
+                # Also send the audio file itself (if not too large and no Google Drive)
+                if not drive_link:
+                    upload = discord_notifier.send_file(
+                        audio_path, "🎧 **Your audio summary is ready!**"
+                    )
+                    # Waits for the upload so a failed attachment is reported
+                    if upload is None or not upload.result():
+                        console.print(
+                            "[yellow]⚠ Audio file was not attached to Discord[/yellow]"
+                        )
+
+        except Exception as e:
+            console.print(f"[red]❌ TTS Error: {e}[/red]")
+            console.print(
+                f"[blue]📄 Script was generated successfully ({len(script)} characters)[/blue]"
+            )
+            # Send Discord error notification
+            if discord_notifier.is_enabled():
+                discord_notifier.send_error_notification(str(e), "TTS Audio Generation")
+            return 1
+
+        return 0
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠️ Interrupted by user[/yellow]")
+        return 130
+    except Exception as e:
+        console.print(f"\n[red]❌ Error: {e}[/red]")
+        console.print_exception()
+        # Send Discord error notification
+        if "discord_notifier" in locals() and discord_notifier.is_enabled():
+            discord_notifier.send_error_notification(str(e), "General Execution")
+        return 1
+    finally:
+        flush_events()
+        if "discord_notifier" in locals():
+            discord_notifier.flush()
+        try:
+            db_manager.close()
+        except:
+            pass
@@ -1,206 +1,756 @@
+import hashlib
 import os
+import threading
 import time
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from github import Github, RateLimitExceededException
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Callable, Dict, Any, Iterator, List, Mapping
+from datetime import datetime, timezone
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from rich.console import Console
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_random_exponential,
+    retry_if_exception,
 )
 
+from ..utils.database import DatabaseManager
+from ..utils.http_cache import ETagCache, parse_max_age
+
 console = Console()
 
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Fields requested for every issue in batched GraphQL queries
+ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+  databaseId
+  number
+  title
+  body
+  url
+  state
+  createdAt
+  updatedAt
+  authorAssociation
+  comments { totalCount }
+  labels(first: 20) { nodes { name } }
+  assignees(first: 10) { nodes { login } }
+}
+"""
+
+# Fields requested for every repository in batched GraphQL searches
+REPOSITORY_FIELDS_FRAGMENT = """
+fragment RepositoryFields on Repository {
+  databaseId
+  name
+  nameWithOwner
+  description
+  url
+  stargazerCount
+  forkCount
+  primaryLanguage { name }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  licenseInfo { name }
+  createdAt
+  updatedAt
+  pushedAt
+  issues(states: OPEN) { totalCount }
+  hasIssuesEnabled
+  isArchived
+  isDisabled
+}
+"""
+
+
+@lru_cache(maxsize=64)
+def build_search_query(
+    topic: str, min_stars: int, max_stars: int, exclude_archived: bool = True
+) -> str:
+    """Build a repository search query for one topic.
+
+    Identical inputs always yield the identical string, which keeps the
+    ETag cache key stable across runs.
+    """
+    query_parts = [f"topic:{topic}", f"stars:{min_stars}..{max_stars}", "is:public"]
+
+    if exclude_archived:
+        query_parts.append("archived:false")
+
+    return " ".join(query_parts)
+
+
+def graphql_string(value: str) -> str:
+    """Quote a value as a GraphQL string literal (JSON string syntax)."""
+    return orjson.dumps(value).decode()
+
+
+def create_session(pool_size: int = 32) -> requests.Session:
+    """Create a pooled, compression-enabled session for GitHub API traffic."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    # Advertises brotli/zstd too when their decoders are installed
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+# Seconds repository search results are reused across runs
+SEARCH_CACHE_TTL = 24 * 60 * 60
+
+
+class RateLimitExceededException(Exception):
+    """Raised when GitHub rejects a request for exceeding a rate limit."""
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed GitHub request is worth retrying."""
+    if isinstance(exc, (RateLimitExceededException, requests.ConnectionError)):
+        return True
+    if isinstance(exc, requests.Timeout):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500
+    return False
+
+
+# Retry transient failures with jittered exponential backoff. Rate-limit
+# retries then wait in RateLimiter.acquire until the window resets.
+github_retry = retry(
+    retry=retry_if_exception(_is_transient),
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    reraise=True,
+)
+
+
+class RateLimiter:
+    """Client-side rate limiter driven by GitHub's X-RateLimit-* headers.
+
+    Each resource ("core", "search", "graphql") keeps the last reported
+    remaining budget and reset time. Requests draw from that budget and
+    stall until the window resets once it falls to the reserve. An optional
+    refresh callback re-reads the live budget once before stalling.
+    """
+
+    # Requests to hold back per resource before stalling
+    DEFAULT_RESERVES = {"core": 100, "search": 2, "graphql": 100}
+
+    def __init__(
+        self,
+        reserves: Optional[Dict[str, int]] = None,
+        refresh: Optional[Callable[[], Any]] = None,
+    ):
+        self.reserves = {**self.DEFAULT_RESERVES, **(reserves or {})}
+        self.refresh = refresh
+        self._remaining: Dict[str, int] = {}
+        # Reset deadlines on the monotonic clock, immune to wall-clock jumps
+        self._reset_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, resource: str = "core") -> Iterator[None]:
+        """Reserve one request from a resource, waiting for reset if exhausted."""
+        verified = self.refresh is None
+        while True:
+            with self._lock:
+                remaining = self._remaining.get(resource)
+                reset_at = self._reset_at.get(resource, 0.0)
+                wait_time = reset_at - time.monotonic()
+
+                if (
+                    remaining is None
+                    or remaining > self.reserves.get(resource, 0)
+                    or wait_time <= 0
+                ):
+                    if remaining is not None:
+                        self._remaining[resource] = remaining - 1
+                    break
+
+            # Local counts can drift; confirm with GitHub before sleeping
+            if not verified:
+                verified = True
+                try:
+                    self.refresh()
+                    continue
+                except Exception:
+                    pass
+
+            console.print(
+                f"[yellow]{resource.title()} rate limit low, waiting {wait_time:.0f}s...[/yellow]"
+            )
+            time.sleep(wait_time + 1)
+
+        yield
+
+    def update_from_headers(
+        self, headers: Mapping[str, str], resource: Optional[str] = None
+    ) -> None:
+        """Refresh a resource's budget from response headers."""
+        resource = headers.get("X-RateLimit-Resource", resource or "core")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        retry_after = headers.get("Retry-After")
+
+        with self._lock:
+            if remaining is not None:
+                self._remaining[resource] = int(remaining)
+            if reset is not None:
+                self._reset_at[resource] = self._deadline(float(reset))
+
+            # Secondary limits only report how long to back off
+            if retry_after is not None:
+                self._remaining[resource] = 0
+                self._reset_at[resource] = time.monotonic() + float(retry_after)
+
+    @staticmethod
+    def _deadline(reset_epoch: float) -> float:
+        """Convert GitHub's epoch reset time to a monotonic deadline."""
+        return time.monotonic() + (reset_epoch - time.time())
+
+    def update(self, resource: str, remaining: int, reset: float) -> None:
+        """Set a resource's budget from a /rate_limit snapshot."""
+        with self._lock:
+            self._remaining[resource] = remaining
+            self._reset_at[resource] = self._deadline(reset)
+
+    def remaining(self, resource: str = "core") -> Optional[int]:
+        """Last known remaining budget for a resource."""
+        return self._remaining.get(resource)
+
+
+class GraphQLClient:
+    """Minimal GitHub GraphQL API client for batched queries."""
+
+    def __init__(
+        self,
+        token: str,
+        timeout: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        self.session = session or create_session()
+        self.headers = {
+            "Authorization": f"bearer {token}",
+            "Content-Type": "application/json",
+        }
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    @github_retry
+    def execute(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query and return its data payload."""
+        with self.rate_limiter.acquire("graphql"):
+            response = self.session.post(
+                GITHUB_GRAPHQL_URL,
+                data=orjson.dumps({"query": query, "variables": variables or {}}),
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        self.rate_limiter.update_from_headers(response.headers, "graphql")
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+
+        # Partial errors (e.g. one missing repository) still return data
+        if payload.get("data") is None:
+            errors = payload.get("errors") or [{"message": "empty response"}]
+            raise RuntimeError(f"GraphQL query failed: {errors[0].get('message')}")
+
+        return payload["data"]
+
 
 class GitHubClient:
     """GitHub API client with rate limiting and error handling."""
 
-    def __init__(self, token: Optional[str] = None):
-        """Initialize GitHub client with authentication."""
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        use_cache: bool = True,
+        db_manager: Optional[DatabaseManager] = None,
+        probe_rate_limits: bool = True,
+        refresh_search_cache: bool = False,
+    ):
+        """Initialize GitHub client with authentication.
+
+        With ``refresh_search_cache`` set, cached search results are ignored
+        but fresh results are still stored for later runs.
+        """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
             raise ValueError(
                 "GitHub token required. Set GITHUB_TOKEN environment variable."
             )
 
-        self.github = Github(self.token)
         self.rate_limit_buffer = 100  # Keep buffer to avoid hitting limits
+        self.rate_limiter = RateLimiter(
+            {"core": self.rate_limit_buffer}, refresh=self._fetch_rate_limits
+        )
+
+        # One pooled session shared by REST and GraphQL keeps connections warm
+        self.session = create_session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json",
+            }
+        )
+        self.graphql = GraphQLClient(
+            self.token, rate_limiter=self.rate_limiter, session=self.session
+        )
+
+        # Conditional-request cache for unchanged REST resources, plus a daily
+        # cache of search results, which the 30 req/min search limit makes costly
+        self.db_manager = (db_manager or DatabaseManager()) if use_cache else None
+        self.http_cache = ETagCache(self.db_manager) if use_cache else None
+        self.refresh_search_cache = refresh_search_cache
 
         console.print("[green]✓[/green] GitHub client initialized")
-        self._print_rate_limits()
+        if probe_rate_limits:
+            self.print_rate_limits()
 
-    def _print_rate_limits(self):
+    def _search_cache_key(self, *parts: Any) -> str:
+        """Cache key for a search, bucketed by UTC day."""
+        raw = "|".join(map(str, (*parts, datetime.now(timezone.utc).date())))
+        return (
+            "search:" + hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        )
+
+    def _get_cached_search(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached search results, or None on a miss or refresh."""
+        if self.db_manager is None or self.refresh_search_cache:
+            return None
+        try:
+            payload = self.db_manager.get_cached_result(key)
+            return orjson.loads(payload) if payload else None
+        except Exception:
+            # A broken cache only costs a live search
+            return None
+
+    def _put_cached_search(self, key: str, results: List[Dict[str, Any]]) -> None:
+        """Store search results for SEARCH_CACHE_TTL seconds."""
+        if self.db_manager is None:
+            return
+        try:
+            self.db_manager.put_cached_result(
+                key, orjson.dumps(results), ttl=SEARCH_CACHE_TTL
+            )
+        except Exception:
+            # Failing to cache must not fail the search
+            pass
+
+    def _fetch_rate_limits(self) -> Dict[str, Any]:
+        """Fetch live rate limits and seed the limiter with them."""
+        # Bypasses the limiter: /rate_limit is free and is used to verify it
+        response = self.session.get(f"{GITHUB_API_URL}/rate_limit", timeout=30)
+        response.raise_for_status()
+        resources = orjson.loads(response.content)["resources"]
+
+        for resource, rate in resources.items():
+            self.rate_limiter.update(resource, rate["remaining"], rate["reset"])
+
+        return resources
+
+    def print_rate_limits(self):
         """Print current rate limit status."""
         try:
-            core_rate = self.github.get_rate_limit().core
-            search_rate = self.github.get_rate_limit().search
+            resources = self._fetch_rate_limits()
+            core_rate = resources["core"]
+            search_rate = resources["search"]
 
             console.print("[blue]Rate Limits:[/blue]")
             console.print(
-                f"  Core: {core_rate.remaining}/{core_rate.limit} (resets at {core_rate.reset})"
+                f"  Core: {core_rate['remaining']}/{core_rate['limit']} (resets at {datetime.fromtimestamp(core_rate['reset'])})"
             )
             console.print(
-                f"  Search: {search_rate.remaining}/{search_rate.limit} (resets at {search_rate.reset})"
+                f"  Search: {search_rate['remaining']}/{search_rate['limit']} (resets at {datetime.fromtimestamp(search_rate['reset'])})"
             )
         except Exception as e:
             console.print(f"[yellow]Warning: Could not fetch rate limits: {e}[/yellow]")
 
-    @retry(
-        retry=retry_if_exception_type(RateLimitExceededException),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
+    @github_retry
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a REST endpoint, replaying cached bodies on 304 Not Modified."""
+        url = f"{GITHUB_API_URL}{path}"
+        cache_key = f"{url}?{sorted((params or {}).items())}"
+        http_cache = self.http_cache
+
+        entry = http_cache.get(cache_key) if http_cache else None
+        if http_cache and http_cache.is_fresh(entry):
+            # Within max-age, so reuse without a round-trip
+            return entry["body"]
+        headers = http_cache.conditional_headers(entry) if http_cache else {}
+
+        resource = "search" if path.startswith("/search/") else "core"
+        with self.rate_limiter.acquire(resource):
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
+        self.rate_limiter.update_from_headers(response.headers, resource)
+
+        # Conditional hits don't count against the primary rate limit
+        max_age = parse_max_age(response.headers.get("Cache-Control"))
+        if response.status_code == 304 and entry is not None:
+            http_cache.refresh(cache_key, max_age)
+            return entry["body"]
+
+        # Primary limits report zero remaining; secondary limits send Retry-After
+        if response.status_code in (403, 429) and (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+        ):
+            raise RateLimitExceededException(
+                f"GitHub rate limit exceeded ({response.status_code}) for {path}"
+            )
+
+        response.raise_for_status()
+        body = orjson.loads(response.content)
+
+        if http_cache:
+            http_cache.put(
+                cache_key,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                max_age=max_age,
+            )
+
+        return body
+
+    def _iter_pages(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        items_key: Optional[str] = None,
+        max_pages: int = 10,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items across 100-per-page results until a short page.
+
+        Pages are fetched only as the caller consumes items. Callers should
+        stop pulling once they have enough (e.g. with islice): asking for one
+        more item after a full page fetches the next page.
+        """
+        for page in range(1, max_pages + 1):
+            body = self._get(path, params={**params, "per_page": 100, "page": page})
+            items = body.get(items_key, []) if items_key else body
+            yield from items
+
+            if len(items) < 100:
+                return
+
     def search_repositories(
         self, query: str, sort: str = "stars", order: str = "desc", per_page: int = 100
     ) -> List[Dict[str, Any]]:
         """Search repositories with rate limit handling."""
-        self._check_rate_limits()
+        cache_key = self._search_cache_key("rest", query, sort, order, per_page)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            search_result = self.github.search_repositories(
-                query=query, sort=sort, order=order
+            results = self._iter_pages(
+                "/search/repositories",
+                params={"q": query, "sort": sort, "order": order},
+                items_key="items",
             )
 
-            repositories = []
-            count = 0
-
-            for repo in search_result:
-                if count >= per_page:
-                    break
-
-                repo_data = {
-                    "id": repo.id,
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "html_url": repo.html_url,
-                    "stargazers_count": repo.stargazers_count,
-                    "forks_count": repo.forks_count,
-                    "language": repo.language,
-                    "topics": getattr(
-                        repo, "topics", []
-                    ),  # Use cached topics if available
-                    "license": getattr(getattr(repo, "license", None), "name", None),
-                    "created_at": repo.created_at,
-                    "updated_at": repo.updated_at,
-                    "pushed_at": repo.pushed_at,
-                    "open_issues_count": repo.open_issues_count,
-                    "has_issues": repo.has_issues,
-                    "archived": repo.archived,
-                    "disabled": getattr(repo, "disabled", False),
-                }
-
-                repositories.append(repo_data)
-                count += 1
+            repositories = [
+                self._repository_to_dict(repo) for repo in islice(results, per_page)
+            ]
 
-            console.print(f"[green]✓[/green] Found {len(repositories)} repositories")
+            self._put_cached_search(cache_key, repositories)
             return repositories
 
         except RateLimitExceededException:
-            console.print("[yellow]Rate limit exceeded, retrying...[/yellow]")
+            console.print("[yellow]Rate limit exceeded while searching[/yellow]")
             raise
         except Exception as e:
             console.print(f"[red]Error searching repositories: {e}[/red]")
             raise
 
-    @retry(
-        retry=retry_if_exception_type(RateLimitExceededException),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
+    def get_repository(self, full_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch one repository by owner/name, or None if it doesn't exist."""
+        try:
+            return self._repository_to_dict(self._get(f"/repos/{full_name}"))
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    @staticmethod
+    def _repository_to_dict(repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a REST repository object to Repository model fields."""
+        return {
+            "id": repo["id"],
+            "name": repo["name"],
+            "full_name": repo["full_name"],
+            "description": repo.get("description"),
+            "html_url": repo["html_url"],
+            "stargazers_count": repo["stargazers_count"],
+            "forks_count": repo["forks_count"],
+            "language": repo.get("language"),
+            "topics": repo.get("topics", []),
+            "license": (repo.get("license") or {}).get("name"),
+            "created_at": repo["created_at"],
+            "updated_at": repo["updated_at"],
+            "pushed_at": repo.get("pushed_at"),
+            "open_issues_count": repo["open_issues_count"],
+            "has_issues": repo.get("has_issues", True),
+            "archived": repo.get("archived", False),
+            "disabled": repo.get("disabled", False),
+        }
+
+    def search_issues(self, query: str, per_page: int = 100) -> List[Dict[str, Any]]:
+        """Search issues, returning up to per_page raw REST issue objects."""
+        results = self._iter_pages("/search/issues", {"q": query}, items_key="items")
+        return list(islice(results, per_page))
+
     def get_repository_issues(
         self,
         repo_full_name: str,
         state: str = "open",
         labels: Optional[List[str]] = None,
         per_page: int = 100,
+        repo_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get issues from a specific repository."""
-        self._check_rate_limits()
-
         try:
-            repo = self.github.get_repo(repo_full_name)
+            if repo_id is None:
+                repo_id = self._get(f"/repos/{repo_full_name}")["id"]
 
-            # Get issues - we'll filter by labels after fetching
-            issues = repo.get_issues(state=state)
+            if labels:
+                # The issues listing ANDs labels; search ORs a comma-separated list
+                label_filter = ",".join(f'"{label}"' for label in labels)
+                issues = self.search_issues(
+                    f"repo:{repo_full_name} is:issue is:{state} label:{label_filter}",
+                    per_page=per_page,
+                )
+            else:
+                issues = self._iter_pages(
+                    f"/repos/{repo_full_name}/issues", params={"state": state}
+                )
 
             issue_list = []
-            count = 0
 
             for issue in issues:
-                if count >= per_page:
-                    break
-
                 # Skip pull requests (they appear as issues in GitHub API)
-                if issue.pull_request:
+                if issue.get("pull_request"):
                     continue
 
+                assignee = issue.get("assignee")
                 issue_data = {
-                    "id": issue.id,
-                    "number": issue.number,
-                    "title": issue.title,
-                    "body": issue.body,
-                    "html_url": issue.html_url,
-                    "state": issue.state,
-                    "labels": [label.name for label in issue.labels],
-                    "assignee": issue.assignee.login if issue.assignee else None,
-                    "assignees": [assignee.login for assignee in issue.assignees],
-                    "comments": issue.comments,
-                    "created_at": issue.created_at,
-                    "updated_at": issue.updated_at,
-                    "author_association": getattr(issue, "author_association", "NONE"),
-                    "repo_id": repo.id,
+                    "id": issue["id"],
+                    "number": issue["number"],
+                    "title": issue["title"],
+                    "body": issue.get("body"),
+                    "html_url": issue["html_url"],
+                    "state": issue["state"],
+                    "labels": [label["name"] for label in issue.get("labels", [])],
+                    "assignee": assignee["login"] if assignee else None,
+                    "assignees": [a["login"] for a in issue.get("assignees", [])],
+                    "comments": issue["comments"],
+                    "created_at": issue["created_at"],
+                    "updated_at": issue["updated_at"],
+                    "author_association": issue.get("author_association", "NONE"),
+                    "repo_id": repo_id,
                     "repo_full_name": repo_full_name,
                 }
 
                 issue_list.append(issue_data)
-                count += 1
 
-            console.print(
-                f"[green]✓[/green] Found {len(issue_list)} issues in {repo_full_name}"
-            )
+                # Stop before pulling another item, which could fetch a page
+                if len(issue_list) >= per_page:
+                    break
+
             return issue_list
 
         except RateLimitExceededException:
-            console.print("[yellow]Rate limit exceeded, retrying...[/yellow]")
+            console.print(f"[yellow]Rate limit exceeded for {repo_full_name}[/yellow]")
             raise
         except Exception as e:
             console.print(f"[red]Error getting issues from {repo_full_name}: {e}[/red]")
             return []
 
-    def _check_rate_limits(self):
-        """Check if we're approaching rate limits."""
-        try:
-            rate_limit = self.github.get_rate_limit()
+    def search_repositories_batch(
+        self, queries: Mapping[str, str], per_query: int = 100
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run several repository searches with one GraphQL query, sorted by stars."""
+        cache_keys = {
+            key: self._search_cache_key("graphql", query, per_query)
+            for key, query in queries.items()
+        }
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for key, cache_key in cache_keys.items():
+            cached = self._get_cached_search(cache_key)
+            if cached is not None:
+                results[key] = cached
 
-            # Check core API rate limit
-            if rate_limit.core.remaining < self.rate_limit_buffer:
-                wait_time = (rate_limit.core.reset - datetime.now()).total_seconds()
-                if wait_time > 0:
-                    console.print(
-                        f"[yellow]Rate limit low, waiting {wait_time:.0f}s...[/yellow]"
-                    )
-                    time.sleep(wait_time + 1)
+        # Only searches missing from the cache go to GitHub
+        keys = [key for key in queries if key not in results]
+        if not keys:
+            return results
 
-            # Check search API rate limit
-            if rate_limit.search.remaining < 5:
-                wait_time = (rate_limit.search.reset - datetime.now()).total_seconds()
-                if wait_time > 0:
+        blocks = [
+            f"s{i}: search(query: {graphql_string(queries[key] + ' sort:stars-desc')}, "
+            f"type: REPOSITORY, first: {min(per_query, 100)}) {{\n"
+            f"  nodes {{ ...RepositoryFields }}\n"
+            f"}}"
+            for i, key in enumerate(keys)
+        ]
+
+        query = "query {\n" + "\n".join(blocks) + "\n}\n" + REPOSITORY_FIELDS_FRAGMENT
+        data = self.graphql.execute(query)
+
+        for i, key in enumerate(keys):
+            search_node = data.get(f"s{i}") or {"nodes": []}
+            # Non-repository hits come back as empty objects
+            results[key] = [
+                self._repository_node_to_dict(node)
+                for node in search_node["nodes"]
+                if node
+            ]
+            self._put_cached_search(cache_keys[key], results[key])
+
+        return {key: results[key] for key in queries}
+
+    def _repository_node_to_dict(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL repository node onto the REST-style repository dict."""
+        return {
+            "id": node["databaseId"],
+            "name": node["name"],
+            "full_name": node["nameWithOwner"],
+            "description": node["description"],
+            "html_url": node["url"],
+            "stargazers_count": node["stargazerCount"],
+            "forks_count": node["forkCount"],
+            "language": (node["primaryLanguage"] or {}).get("name"),
+            "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+            "license": (node["licenseInfo"] or {}).get("name"),
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "pushed_at": node["pushedAt"],
+            "open_issues_count": node["issues"]["totalCount"],
+            "has_issues": node["hasIssuesEnabled"],
+            "archived": node["isArchived"],
+            "disabled": node["isDisabled"],
+        }
+
+    def get_repository_issues_bulk(
+        self,
+        repo_full_names: List[str],
+        state: str = "open",
+        labels: Optional[List[str]] = None,
+        per_page: int = 100,
+        repo_ids: Optional[Mapping[str, int]] = None,
+        max_workers: int = 8,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get issues for several repositories with concurrent REST calls."""
+        repo_ids = repo_ids or {}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+
+        # The shared rate limiter keeps parallel workers within budget
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_name = {
+                executor.submit(
+                    self.get_repository_issues,
+                    repo_full_name,
+                    state,
+                    labels,
+                    per_page,
+                    repo_ids.get(repo_full_name),
+                ): repo_full_name
+                for repo_full_name in repo_full_names
+            }
+
+            for future in as_completed(future_to_name):
+                repo_full_name = future_to_name[future]
+                try:
+                    results[repo_full_name] = future.result()
+                except Exception as e:
                     console.print(
-                        f"[yellow]Search rate limit low, waiting {wait_time:.0f}s...[/yellow]"
+                        f"[red]Error getting issues from {repo_full_name}: {e}[/red]"
                     )
-                    time.sleep(wait_time + 1)
+                    results[repo_full_name] = []
 
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not check rate limits: {e}[/yellow]")
+        return results
+
+    def get_issues_for_repositories(
+        self,
+        repo_full_names: List[str],
+        labels: Optional[List[str]] = None,
+        per_repo: int = 20,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get open issues for several repositories with one GraphQL query."""
+        blocks = []
+        for i, repo_full_name in enumerate(repo_full_names):
+            owner, name = repo_full_name.split("/", 1)
+            blocks.append(
+                f"r{i}: repository(owner: {graphql_string(owner)}, name: {graphql_string(name)}) {{\n"
+                f"  databaseId\n"
+                f"  issues(first: {min(per_repo, 100)}, states: OPEN, labels: $labels, "
+                f"orderBy: {{field: CREATED_AT, direction: DESC}}) {{\n"
+                f"    nodes {{ ...IssueFields }}\n"
+                f"  }}\n"
+                f"}}"
+            )
+
+        query = (
+            "query($labels: [String!]) {\n"
+            + "\n".join(blocks)
+            + "\n}\n"
+            + ISSUE_FIELDS_FRAGMENT
+        )
+        data = self.graphql.execute(query, {"labels": labels})
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for i, repo_full_name in enumerate(repo_full_names):
+            repo_node = data.get(f"r{i}")
+            if not repo_node:
+                # Repository missing or inaccessible
+                results[repo_full_name] = []
+                continue
+
+            results[repo_full_name] = [
+                self._issue_node_to_dict(node, repo_node["databaseId"], repo_full_name)
+                for node in repo_node["issues"]["nodes"]
+            ]
+
+        return results
+
+    def _issue_node_to_dict(
+        self, node: Dict[str, Any], repo_id: int, repo_full_name: str
+    ) -> Dict[str, Any]:
+        """Map a GraphQL issue node onto the REST-style issue dict."""
+        assignees = [a["login"] for a in node["assignees"]["nodes"]]
+        return {
+            "id": node["databaseId"],
+            "number": node["number"],
+            "title": node["title"],
+            "body": node["body"],
+            "html_url": node["url"],
+            "state": node["state"].lower(),
+            "labels": [label["name"] for label in node["labels"]["nodes"]],
+            "assignee": assignees[0] if assignees else None,
+            "assignees": assignees,
+            "comments": node["comments"]["totalCount"],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "author_association": node["authorAssociation"],
+            "repo_id": repo_id,
+            "repo_full_name": repo_full_name,
+        }
 
     def get_authenticated_user(self):
         """Get authenticated user info for testing."""
         try:
-            user = self.github.get_user()
-            console.print(f"[green]✓[/green] Authenticated as: {user.login}")
+            user = self._get("/user")
+            console.print(f"[green]✓[/green] Authenticated as: {user['login']}")
             return user
         except Exception as e:
             console.print(f"[red]Authentication failed: {e}[/red]")
@@ -1,8 +1,12 @@
-from typing import List, Dict
+import heapq
+import re
+from collections import Counter, defaultdict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich.progress import Progress
 
 from ..models import Repository, Issue
@@ -10,40 +14,70 @@ from .github_client import GitHubClient
 
 console = Console()
 
+# Title/body phrases that signal design work rather than a fixable issue.
+# Substring matches, so "discuss" also catches "discussion".
+_BAD_KEYWORDS_RE = re.compile(
+    r"design|discuss|rfc|proposal|breaking|major refactor|architecture"
+    r"|backwards compatibility",
+    re.IGNORECASE,
+)
+
 
 class IssueDiscoverer:
     """Discovers suitable issues from GitHub repositories."""
 
     # Labels that indicate good issues for automation
-    GOOD_LABELS = {
-        "good first issue",
-        "good-first-issue",
-        "beginner",
-        "easy",
-        "bug",
-        "enhancement",
-        "feature",
-        "help wanted",
-        "hacktoberfest",
-    }
+    GOOD_LABELS = frozenset(
+        {
+            "good first issue",
+            "good-first-issue",
+            "beginner",
+            "easy",
+            "bug",
+            "enhancement",
+            "feature",
+            "help wanted",
+            "hacktoberfest",
+        }
+    )
+
+    # Sorted once so label filters (and the queries built from them) are stable
+    GOOD_LABELS_SORTED = tuple(sorted(GOOD_LABELS))
 
     # Labels that indicate issues we should avoid
-    BAD_LABELS = {
-        "wontfix",
-        "invalid",
-        "duplicate",
-        "question",
-        "discussion",
-        "needs-design",
-        "breaking-change",
-        "major",
-        "epic",
-        "tracking",
-    }
+    BAD_LABELS = frozenset(
+        {
+            "wontfix",
+            "invalid",
+            "duplicate",
+            "question",
+            "discussion",
+            "needs-design",
+            "breaking-change",
+            "major",
+            "epic",
+            "tracking",
+        }
+    )
+
+    # Repositories per GraphQL query (keeps query cost well under the node limit)
+    GRAPHQL_BATCH_SIZE = 25
 
     def __init__(self, github_client: GitHubClient):
         self.github = github_client
-        self.discovered_issues: List[Issue] = []
+        self._top_issues_cache: Optional[Tuple[int, List[Issue]]] = None
+        self.discovered_issues = []
+
+    @property
+    def discovered_issues(self) -> List[Issue]:
+        """Issues kept by the last discovery run."""
+        return self._discovered_issues
+
+    @discovered_issues.setter
+    def discovered_issues(self, issues: List[Issue]) -> None:
+        # A new issue list invalidates the cached top-issue selection
+        self._discovered_issues = issues
+        self._top_issues_cache = None
 
     def discover_issues(
         self,
@@ -52,173 +86,141 @@ class IssueDiscoverer:
         include_unlabeled: bool = False,
         max_workers: int = 3,
     ) -> List[Issue]:
-        """Discover issues from the given repositories in parallel."""
-        all_issues = []
+        """Discover issues from the given repositories using batched GraphQL queries."""
+        suitable_issues = []
+        total = 0
 
-        with Progress() as progress:
+        # A slower refresh keeps rendering off the hot path of busy scans
+        with Progress(refresh_per_second=4) as progress:
             task = progress.add_task(
                 "[green]Discovering issues...", total=len(repositories)
             )
 
-            # Use ThreadPoolExecutor for parallel repository processing
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all repository scanning tasks
-                future_to_repo = {
+            batches = [
+                repositories[start : start + self.GRAPHQL_BATCH_SIZE]
+                for start in range(0, len(repositories), self.GRAPHQL_BATCH_SIZE)
+            ]
+
+            # Batches are independent queries, so run them concurrently
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                future_to_batch = {
                     executor.submit(
-                        self._get_repository_issues_with_logging,
-                        repo,
+                        self._get_batch_issues,
+                        batch,
                         max_issues_per_repo,
                         include_unlabeled,
-                    ): repo
-                    for repo in repositories
+                        max_workers,
+                    ): batch
+                    for batch in batches
                 }
 
-                # Process completed tasks as they finish
-                for future in as_completed(future_to_repo):
-                    repo = future_to_repo[future]
+                for future in as_completed(future_to_batch):
+                    # Filter each batch as it lands rather than holding every
+                    # fetched issue; ranking happens in get_top_issues
+                    batch = future_to_batch[future]
+                    progress.advance(task, len(batch))
                     try:
-                        issues = future.result()
-                        all_issues.extend(issues)
+                        batch_issues = future.result()
                     except Exception as e:
+                        # One failed batch must not abort the whole run
+                        repo_names = ", ".join(repo.full_name for repo in batch)
                         console.print(
-                            f"  [red]✗[/red] Error scanning {repo.full_name}: {e}"
+                            f"  [red]✗[/red] Error fetching issues for {repo_names}: {e}"
                         )
+                        continue
 
-                    progress.update(task, advance=1)
+                    total += len(batch_issues)
+                    suitable_issues.extend(
+                        filter(self._is_issue_suitable, batch_issues)
+                    )
 
-        # Filter and prioritize issues
-        filtered_issues = self._filter_and_prioritize_issues(all_issues)
+        console.print(
+            f"[blue]ℹ[/blue] Filtered to {len(suitable_issues)} suitable issues from {total} total"
+        )
 
-        self.discovered_issues = filtered_issues
+        self.discovered_issues = suitable_issues
         self._print_discovery_summary()
 
-        return filtered_issues
+        return suitable_issues
 
-    def _get_repository_issues_with_logging(
-        self, repository: Repository, max_issues: int, include_unlabeled: bool
+    def _get_batch_issues(
+        self,
+        repositories: List[Repository],
+        max_issues: int,
+        include_unlabeled: bool,
+        max_workers: int,
     ) -> List[Issue]:
-        """Get issues from a repository with console logging (thread-safe)."""
-        console.print(f"\n[blue]🔍 Scanning {repository.full_name}...[/blue]")
-
+        """Fetch a batch with one GraphQL query, falling back to REST on failure."""
         try:
-            issues = self._get_repository_issues(
-                repository, max_issues, include_unlabeled
+            return self._get_batch_issues_graphql(
+                repositories, max_issues, include_unlabeled
             )
+        except Exception as e:
+            # Fall back to per-repository REST calls for this batch
             console.print(
-                f"  [green]✓[/green] Found {len(issues)} suitable issues in {repository.full_name}"
+                f"  [yellow]⚠[/yellow] GraphQL batch failed ({e}), falling back to REST"
+            )
+            return self._get_batch_issues_rest(
+                repositories, max_issues, include_unlabeled, max_workers
             )
-            return issues
-        except Exception as e:
-            console.print(f"  [red]✗[/red] Error in {repository.full_name}: {e}")
-            return []
 
-    def _get_repository_issues(
-        self, repository: Repository, max_issues: int, include_unlabeled: bool
+    def _get_batch_issues_graphql(
+        self,
+        repositories: List[Repository],
+        max_issues: int,
+        include_unlabeled: bool,
     ) -> List[Issue]:
-        """Get issues from a specific repository."""
-        issues = []
-
-        try:
-            # First, try to get issues with good labels
-            for label_batch in self._get_label_batches():
-                if len(issues) >= max_issues:
-                    break
-
-                try:
-                    issue_data_list = self.github.get_repository_issues(
-                        repo_full_name=repository.full_name,
-                        state="open",
-                        labels=label_batch,
-                        per_page=max_issues - len(issues),
-                    )
-
-                    for issue_data in issue_data_list:
-                        issue_data["discovered_at"] = datetime.now()
-                        issue = Issue(**issue_data)
-                        issues.append(issue)
-
-                except Exception as e:
-                    console.print(
-                        f"    [yellow]Warning: Could not fetch issues with labels {label_batch}: {e}[/yellow]"
-                    )
-                    continue
-
-            # If we still need more issues and include_unlabeled is True
-            if len(issues) < max_issues and include_unlabeled:
-                try:
-                    remaining = max_issues - len(issues)
-                    issue_data_list = self.github.get_repository_issues(
-                        repo_full_name=repository.full_name,
-                        state="open",
-                        per_page=remaining,
-                    )
-
-                    # Filter out issues we already have
-                    existing_ids = {issue.id for issue in issues}
-
-                    for issue_data in issue_data_list:
-                        if issue_data["id"] not in existing_ids:
-                            issue_data["discovered_at"] = datetime.now()
-                            issue = Issue(**issue_data)
-                            issues.append(issue)
-
-                except Exception as e:
-                    console.print(
-                        f"    [yellow]Warning: Could not fetch unlabeled issues: {e}[/yellow]"
-                    )
+        """Fetch issues for a batch of repositories in a single GraphQL request."""
+        labels = None if include_unlabeled else list(self.GOOD_LABELS_SORTED)
+        issues_by_repo = self.github.get_issues_for_repositories(
+            [repo.full_name for repo in repositories],
+            labels=labels,
+            per_repo=max_issues,
+        )
 
-        except Exception as e:
-            console.print(
-                f"[red]Error getting issues from {repository.full_name}: {e}[/red]"
-            )
-            return []
+        return self._to_issues(issues_by_repo)
 
-        return issues
+    def _get_batch_issues_rest(
+        self,
+        repositories: List[Repository],
+        max_issues: int,
+        include_unlabeled: bool,
+        max_workers: int,
+    ) -> List[Issue]:
+        """Fetch issues for a batch of repositories with parallel REST calls."""
+        # One labels-ORed search per repository instead of a call per label
+        issues_by_repo = self.github.get_repository_issues_bulk(
+            [repo.full_name for repo in repositories],
+            state="open",
+            labels=None if include_unlabeled else list(self.GOOD_LABELS_SORTED),
+            per_page=max_issues,
+            repo_ids={repo.full_name: repo.id for repo in repositories},
+            max_workers=max_workers,
+        )
 
-    def _get_label_batches(self) -> List[List[str]]:
-        """Get batches of labels to search for."""
-        # GitHub API allows searching for multiple labels, but we'll batch them
-        # to get better coverage
-        return [
-            ["good first issue"],
-            ["good-first-issue"],
-            ["bug"],
-            ["enhancement"],
-            ["help wanted"],
-            ["beginner", "easy"],
-        ]
-
-    def _filter_and_prioritize_issues(self, issues: List[Issue]) -> List[Issue]:
-        """Filter issues and sort by priority."""
-        # Filter out unsuitable issues
-        suitable_issues = []
+        return self._to_issues(issues_by_repo)
 
-        for issue in issues:
-            if self._is_issue_suitable(issue):
-                suitable_issues.append(issue)
+    def _to_issues(self, issues_by_repo: Dict[str, List[dict]]) -> List[Issue]:
+        """Convert per-repository issue data to Issue objects."""
+        # One timestamp per batch rather than one clock read per issue
+        now = datetime.now()
+        issues = []
 
-        # Sort by priority score
-        suitable_issues.sort(key=lambda x: x.priority_score, reverse=True)
+        for issue_data_list in issues_by_repo.values():
+            for issue_data in issue_data_list:
+                issue_data["discovered_at"] = now
+                issues.append(Issue(**issue_data))
 
+        # One line per batch instead of one per repository
         console.print(
-            f"[blue]ℹ[/blue] Filtered to {len(suitable_issues)} suitable issues from {len(issues)} total"
+            f"  [green]✓[/green] Found {len(issues)} issues in {len(issues_by_repo)} repositories"
         )
 
-        return suitable_issues
+        return issues
 
     def _is_issue_suitable(self, issue: Issue) -> bool:
         """Check if an issue is suitable for automated fixing."""
-        # Use the issue's built-in candidate check
-        if not issue.is_good_candidate:
-            return False
-
-        # Additional checks
-
-        # Age filter (not too old, not too new)
-        if issue.age_days > 365:  # Too old
-            return False
-        if issue.age_days < 1:  # Too new (might still be in discussion)
-            return False
+        # Cheapest checks first so most rejections never reach the scans below
 
         # Title quality check
         if len(issue.title) < 10:  # Too short
@@ -228,20 +230,21 @@ class IssueDiscoverer:
         if issue.body and len(issue.body) < 20:  # Too short for meaningful description
             return False
 
-        # Check for bad indicators in title/body
-        bad_keywords = {
-            "design",
-            "discuss",
-            "rfc",
-            "proposal",
-            "breaking",
-            "major refactor",
-            "architecture",
-            "backwards compatibility",
-        }
+        # Age filter (not too old, not too new)
+        age_days = issue.age_days
+        if age_days > 365:  # Too old
+            return False
+        if age_days < 1:  # Too new (might still be in discussion)
+            return False
+
+        # Use the issue's built-in candidate check
+        if not issue.is_good_candidate:
+            return False
 
-        text_to_check = (issue.title + " " + (issue.body or "")).lower()
-        if any(keyword in text_to_check for keyword in bad_keywords):
+        # Check for bad indicators in title/body
+        if _BAD_KEYWORDS_RE.search(issue.title) or (
+            issue.body and _BAD_KEYWORDS_RE.search(issue.body)
+        ):
             return False
 
         return True
@@ -261,7 +264,7 @@ class IssueDiscoverer:
         table.add_column("Priority", justify="right", style="yellow")
 
         # Show top issues
-        for issue in self.discovered_issues[:20]:
+        for issue in self.get_top_issues(limit=20):
             labels_str = ", ".join(issue.labels[:3])  # Show first 3 labels
             if len(issue.labels) > 3:
                 labels_str += "..."
@@ -269,7 +272,8 @@ class IssueDiscoverer:
             table.add_row(
                 issue.repo_full_name.split("/")[1],  # Just repo name, not full
                 str(issue.number),
-                issue.title[:47] + "..." if len(issue.title) > 50 else issue.title,
+                # Text skips markup parsing of user-supplied titles
+                Text(issue.short_title),
                 labels_str,
                 f"{issue.priority_score:.2f}",
             )
@@ -277,38 +281,37 @@ class IssueDiscoverer:
         console.print(table)
 
         # Print statistics
-        repo_counts = {}
-        label_counts = {}
-
-        for issue in self.discovered_issues:
-            repo_counts[issue.repo_full_name] = (
-                repo_counts.get(issue.repo_full_name, 0) + 1
-            )
-            for label in issue.labels:
-                label_counts[label] = label_counts.get(label, 0) + 1
+        repo_counts = Counter(issue.repo_full_name for issue in self.discovered_issues)
+        label_counts = Counter(
+            label for issue in self.discovered_issues for label in issue.labels
+        )
 
         console.print("\n[bold]📊 Statistics:[/bold]")
         console.print(f"  Total issues: {len(self.discovered_issues)}")
         console.print(f"  Repositories: {len(repo_counts)}")
-        console.print(
-            f"  Top labels: {dict(sorted(label_counts.items(), key=lambda x: x[1], reverse=True)[:5])}"
-        )
+        console.print(f"  Top labels: {dict(label_counts.most_common(5))}")
 
         # Print top repositories by issue count
-        top_repos = sorted(repo_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        console.print(f"  Top repos: {dict(top_repos)}")
+        console.print(f"  Top repos: {dict(repo_counts.most_common(5))}")
 
     def get_issues_by_repository(self) -> Dict[str, List[Issue]]:
         """Group issues by repository."""
-        repo_issues = {}
+        repo_issues = defaultdict(list)
 
         for issue in self.discovered_issues:
-            if issue.repo_full_name not in repo_issues:
-                repo_issues[issue.repo_full_name] = []
             repo_issues[issue.repo_full_name].append(issue)
 
-        return repo_issues
+        return dict(repo_issues)
 
     def get_top_issues(self, limit: int = 10) -> List[Issue]:
         """Get top issues by priority score."""
-        return self.discovered_issues[:limit]
+        # Reuse the last selection until discovered_issues is reassigned
+        if self._top_issues_cache and self._top_issues_cache[0] == limit:
+            return list(self._top_issues_cache[1])
+
+        # Partial selection: O(n log k) instead of sorting every issue
+        top_issues = heapq.nlargest(
+            limit, self.discovered_issues, key=lambda x: x.priority_score
+        )
+        self._top_issues_cache = (limit, top_issues)
+        return list(top_issues)
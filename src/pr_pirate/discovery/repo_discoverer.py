@@ -1,4 +1,6 @@
-from typing import List, Optional
+import heapq
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
@@ -6,7 +8,7 @@ from rich.table import Table
 from rich.progress import Progress
 
 from ..models import Repository
-from .github_client import GitHubClient
+from .github_client import GitHubClient, build_search_query
 
 console = Console()
 
@@ -16,39 +18,45 @@ class RepositoryDiscoverer:
 
     # Target topics for LLM/GenAI repositories
     TARGET_TOPICS = {
-        "llm": [
+        "llm": (
             "llm",
             "large-language-model",
             "language-model",
             "gpt",
             "bert",
             "transformer",
-        ],
-        "genai": ["generative-ai", "genai", "ai-generation", "artificial-intelligence"],
-        "llmops": [
+        ),
+        "genai": ("generative-ai", "genai", "ai-generation", "artificial-intelligence"),
+        "llmops": (
             "llmops",
             "mlops",
             "ai-ops",
             "model-deployment",
             "ai-infrastructure",
-        ],
-        "ml": [
+        ),
+        "ml": (
             "machine-learning",
             "deep-learning",
             "neural-network",
             "pytorch",
             "tensorflow",
-        ],
-        "nlp": [
+        ),
+        "nlp": (
             "nlp",
             "natural-language-processing",
             "text-processing",
             "language-understanding",
-        ],
+        ),
     }
 
+    # Search results per topic; a full page costs the same single request, so
+    # fetch it all and cap per topic after deduplication
+    SEARCH_PAGE_SIZE = 100
+
     # Languages we can work with
-    SUPPORTED_LANGUAGES = {"Python", "JavaScript", "TypeScript", "Go", "Rust", "Java"}
+    SUPPORTED_LANGUAGES = frozenset(
+        {"Python", "JavaScript", "TypeScript", "Go", "Rust", "Java"}
+    )
 
     def __init__(self, github_client: GitHubClient):
         self.github = github_client
@@ -64,15 +72,39 @@ class RepositoryDiscoverer:
         max_workers: int = 3,
     ) -> List[Repository]:
         """Discover repositories matching our criteria with parallel search."""
+        filtered_repos = list(
+            self.iter_repositories(
+                categories=categories,
+                min_stars=min_stars,
+                max_stars=max_stars,
+                max_repos_per_query=max_repos_per_query,
+                exclude_archived=exclude_archived,
+                max_workers=max_workers,
+            )
+        )
+
+        self.discovered_repos = filtered_repos
+        self._print_discovery_summary()
+
+        return filtered_repos
+
+    def iter_repositories(
+        self,
+        categories: Optional[List[str]] = None,
+        min_stars: int = 10,
+        max_stars: int = 10000,
+        max_repos_per_query: int = 50,
+        exclude_archived: bool = True,
+        max_workers: int = 3,
+    ) -> Iterator[Repository]:
+        """Yield unique, suitable repositories as each topic search completes."""
         if categories is None:
             categories = list(self.TARGET_TOPICS.keys())
 
-        all_repositories = []
-
         # Get all topics from all categories for parallel processing
         all_topics = []
         for category in categories:
-            topics = self.TARGET_TOPICS.get(category, [category])
+            topics = self.TARGET_TOPICS.get(category, (category,))
             for topic in topics:
                 all_topics.append((category, topic))
 
@@ -80,195 +112,169 @@ class RepositoryDiscoverer:
             f"\n[blue]🔍 Searching {len(all_topics)} topics across {len(categories)} categories...[/blue]"
         )
 
-        with Progress() as progress:
+        seen = set()
+        found_by_category: Counter = Counter()
+        duplicates = 0
+        suitable = 0
+        cutoff = self._activity_cutoff()
+
+        with Progress(refresh_per_second=4) as progress:
             task = progress.add_task(
                 "[green]Discovering repositories...", total=len(all_topics)
             )
 
-            # Use ThreadPoolExecutor for parallel topic searches
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all topic search tasks
-                future_to_topic = {
-                    executor.submit(
-                        self._search_single_topic,
-                        topic,
-                        min_stars,
-                        max_stars,
-                        max_repos_per_query,
-                        exclude_archived,
-                    ): (category, topic)
-                    for category, topic in all_topics
-                }
-
-                # Process completed searches as they finish
-                for future in as_completed(future_to_topic):
-                    category, topic = future_to_topic[future]
-                    try:
-                        repos = future.result()
-                        all_repositories.extend(repos)
-                        console.print(
-                            f"  [green]✓[/green] Found {len(repos)} repos for '{topic}' ({category})"
-                        )
-                    except Exception as e:
-                        console.print(f"  [red]✗[/red] Error searching '{topic}': {e}")
+            for category, topic, repo_data_list in self._iter_topic_results(
+                all_topics,
+                min_stars,
+                max_stars,
+                exclude_archived,
+                max_workers,
+            ):
+                found_by_category[category] += len(repo_data_list)
+                progress.advance(task)
+
+                # Deduplicate before validation and filter inline so
+                # consumers see results early
+                taken = 0
+                for repo_data in repo_data_list:
+                    if taken >= max_repos_per_query:
+                        break
 
-                    progress.update(task, advance=1)
+                    full_name = repo_data["full_name"]
+                    if full_name in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(full_name)
 
-        # Remove duplicates and filter
-        unique_repos = self._deduplicate_repositories(all_repositories)
-        filtered_repos = self._filter_repositories(unique_repos)
+                    repo = self._to_repository(repo_data)
+                    if repo and self._is_repository_suitable(repo, cutoff):
+                        taken += 1
+                        suitable += 1
+                        yield repo
 
-        self.discovered_repos = filtered_repos
-        self._print_discovery_summary()
+        # One line per category rather than one per topic
+        for category in categories:
+            topic_count = len(self.TARGET_TOPICS.get(category, (category,)))
+            console.print(
+                f"  [green]✓[/green] Found {found_by_category[category]} repos across {topic_count} topics ({category})"
+            )
 
-        return filtered_repos
+        console.print(f"[blue]ℹ[/blue] Removed {duplicates} duplicates")
+        console.print(f"[blue]ℹ[/blue] Filtered to {suitable} suitable repositories")
 
-    def _search_single_topic(
+    def _iter_topic_results(
         self,
-        topic: str,
+        all_topics: List[Tuple[str, str]],
         min_stars: int,
         max_stars: int,
-        max_repos: int,
         exclude_archived: bool,
-    ) -> List[Repository]:
-        """Search repositories for a single topic (optimized for parallel execution)."""
-        repositories = []
+        max_workers: int,
+    ) -> Iterator[Tuple[str, str, List[dict]]]:
+        """Yield (category, topic, raw results), batching every topic into one GraphQL query."""
+        # One query per topic: GitHub ANDs multiple topic: qualifiers
+        queries = {
+            topic: build_search_query(topic, min_stars, max_stars, exclude_archived)
+            for _, topic in all_topics
+        }
 
         try:
-            # Build search query
-            query_parts = [
-                f"topic:{topic}",
-                f"stars:{min_stars}..{max_stars}",
-                "is:public",
-            ]
-
-            if exclude_archived:
-                query_parts.append("archived:false")
-
-            query = " ".join(query_parts)
-
-            # Search repositories
-            repo_data_list = self.github.search_repositories(
-                query=query,
-                sort="stars",
-                order="desc",
-                per_page=min(max_repos, 100),
+            results = self.github.search_repositories_batch(
+                queries, per_query=self.SEARCH_PAGE_SIZE
             )
-
-            # Convert to Repository objects (without fetching topics to save API calls)
-            for repo_data in repo_data_list:
-                try:
-                    repo_data["discovered_at"] = datetime.now()
-                    # Use topics from search result instead of making additional API calls
-                    if "topics" not in repo_data:
-                        repo_data["topics"] = []
-                    repo = Repository(**repo_data)
-                    repositories.append(repo)
-                except Exception:
-                    # Skip problematic repos silently during parallel execution
-                    continue
-
         except Exception as e:
-            console.print(f"[red]✗[/red] Failed to search topic '{topic}': {e}")
+            # Fall back to one REST search per topic
+            console.print(
+                f"  [yellow]⚠[/yellow] GraphQL search failed ({e}), falling back to REST"
+            )
+            yield from self._iter_topic_results_rest(all_topics, queries, max_workers)
+            return
 
-        return repositories
+        for category, topic in all_topics:
+            yield category, topic, results[topic]
 
-    def _search_category_repositories(
+    def _iter_topic_results_rest(
         self,
-        category: str,
-        min_stars: int,
-        max_stars: int,
-        max_repos: int,
-        exclude_archived: bool,
-    ) -> List[Repository]:
-        """Search repositories for a specific category."""
-        topics = self.TARGET_TOPICS.get(category, [category])
-        repositories = []
-
-        for topic in topics:
-            try:
-                # Build search query
-                query_parts = [
-                    f"topic:{topic}",
-                    f"stars:{min_stars}..{max_stars}",
-                    "is:public",
-                ]
-
-                if exclude_archived:
-                    query_parts.append("archived:false")
-
-                query = " ".join(query_parts)
-
-                # Search repositories
-                repo_data_list = self.github.search_repositories(
-                    query=query,
-                    sort="stars",
-                    order="desc",
-                    per_page=min(max_repos, 100),
+        all_topics: List[Tuple[str, str]],
+        queries: Dict[str, str],
+        max_workers: int,
+    ) -> Iterator[Tuple[str, str, List[dict]]]:
+        """Yield per-topic REST search results as they complete."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_topic = {
+                executor.submit(self._search_single_topic, topic, queries[topic]): (
+                    category,
+                    topic,
                 )
+                for category, topic in all_topics
+            }
 
-                # Convert to Repository objects
-                for repo_data in repo_data_list:
-                    try:
-                        repo_data["discovered_at"] = datetime.now()
-                        repo = Repository(**repo_data)
-                        repositories.append(repo)
-                    except Exception as e:
-                        console.print(
-                            f"[yellow]Warning: Could not parse repository {repo_data.get('full_name', 'unknown')}: {e}[/yellow]"
-                        )
-                        continue
-
-                console.print(
-                    f"  [green]✓[/green] Found {len(repo_data_list)} repos for topic '{topic}'"
-                )
-
-            except Exception as e:
-                console.print(f"[red]Error searching topic '{topic}': {e}[/red]")
-                continue
-
-        return repositories
+            for future in as_completed(future_to_topic):
+                category, topic = future_to_topic[future]
+                try:
+                    repos = future.result()
+                except Exception as e:
+                    console.print(f"  [red]✗[/red] Error searching '{topic}': {e}")
+                    repos = []
 
-    def _deduplicate_repositories(
-        self, repositories: List[Repository]
-    ) -> List[Repository]:
-        """Remove duplicate repositories."""
-        seen = set()
-        unique_repos = []
+                yield category, topic, repos
 
-        for repo in repositories:
-            if repo.full_name not in seen:
-                seen.add(repo.full_name)
-                unique_repos.append(repo)
+    def _search_single_topic(self, topic: str, query: str) -> List[dict]:
+        """Search repositories for a single topic (optimized for parallel execution)."""
+        try:
+            return self.github.search_repositories(
+                query=query,
+                sort="stars",
+                order="desc",
+                per_page=self.SEARCH_PAGE_SIZE,
+            )
+        except Exception as e:
+            console.print(f"[red]✗[/red] Failed to search topic '{topic}': {e}")
+            return []
 
-        console.print(
-            f"[blue]ℹ[/blue] Removed {len(repositories) - len(unique_repos)} duplicates"
-        )
-        return unique_repos
+    def _to_repository(self, repo_data: dict) -> Optional[Repository]:
+        """Convert a search result to a Repository, or None if malformed."""
+        try:
+            # Use topics from search result instead of making additional API calls
+            if "topics" not in repo_data:
+                repo_data["topics"] = []
+            return Repository(**repo_data)
+        except Exception:
+            # Skip problematic repos silently
+            return None
 
     def _filter_repositories(self, repositories: List[Repository]) -> List[Repository]:
         """Filter repositories based on our criteria."""
-        filtered = []
-
-        for repo in repositories:
-            if self._is_repository_suitable(repo):
-                filtered.append(repo)
+        cutoff = self._activity_cutoff()
+        is_suitable = self._is_repository_suitable
+        filtered = [repo for repo in repositories if is_suitable(repo, cutoff)]
 
         console.print(
             f"[blue]ℹ[/blue] Filtered to {len(filtered)} suitable repositories"
         )
         return filtered
 
-    def _is_repository_suitable(self, repo: Repository) -> bool:
-        """Check if repository meets our suitability criteria."""
+    @staticmethod
+    def _activity_cutoff() -> float:
+        """Timestamp before which a repository counts as inactive (6 months)."""
+        return (datetime.now() - timedelta(days=180)).timestamp()
+
+    def _is_repository_suitable(
+        self, repo: Repository, cutoff: Optional[float] = None
+    ) -> bool:
+        """Check if repository meets our suitability criteria.
+
+        Pass a precomputed ``cutoff`` from _activity_cutoff when filtering
+        many repositories.
+        """
         # Basic viability check (has issues, not archived/disabled)
         if not repo.has_issues or repo.archived or repo.disabled:
             return False
 
         # Activity check (must be updated within last 6 months)
         if repo.pushed_at:
-            six_months_ago = datetime.now() - timedelta(days=180)
-            if repo.pushed_at.replace(tzinfo=None) < six_months_ago:
+            if cutoff is None:
+                cutoff = self._activity_cutoff()
+            if repo.pushed_at.timestamp() < cutoff:
                 return False
 
         # Issue activity check
@@ -291,14 +297,12 @@ class RepositoryDiscoverer:
         table.add_column("Issues", justify="right", style="green")
         table.add_column("Activity", style="blue")
 
-        # Sort by priority (stars * activity_score)
-        sorted_repos = sorted(
-            self.discovered_repos,
-            key=lambda r: r.stars * r.activity_score,
-            reverse=True,
+        # Top 20 by priority (stars * activity_score), without a full sort
+        top_repos = heapq.nlargest(
+            20, self.discovered_repos, key=lambda r: r.stars * r.activity_score
         )
 
-        for repo in sorted_repos[:20]:  # Show top 20
+        for repo in top_repos:
             activity = f"{repo.activity_score:.1f}"
             table.add_row(
                 repo.full_name,
@@ -311,74 +315,60 @@ class RepositoryDiscoverer:
         console.print(table)
 
         # Print statistics
-        languages = {}
-        total_issues = 0
-
-        for repo in self.discovered_repos:
-            lang = repo.language or "Unknown"
-            languages[lang] = languages.get(lang, 0) + 1
-            total_issues += repo.open_issues_count
+        languages = Counter(
+            repo.language or "Unknown" for repo in self.discovered_repos
+        )
+        total_issues = sum(repo.open_issues_count for repo in self.discovered_repos)
 
         console.print("\n[bold]📊 Statistics:[/bold]")
         console.print(f"  Total repositories: {len(self.discovered_repos)}")
         console.print(f"  Total open issues: {total_issues}")
-        console.print(
-            f"  Languages: {dict(sorted(languages.items(), key=lambda x: x[1], reverse=True))}"
-        )
+        console.print(f"  Languages: {dict(languages.most_common())}")
 
     def get_top_repositories(self, limit: int = 10) -> List[Repository]:
         """Get top repositories by priority score."""
         if not self.discovered_repos:
             return []
 
-        # Sort by composite score (stars * activity * issue_density)
-        def priority_score(repo: Repository) -> float:
-            issue_density = repo.open_issues_count / max(repo.stars, 1)
-            return repo.stars * repo.activity_score * min(issue_density, 1.0)
+        # Partial selection: O(n log k) instead of sorting every repository
+        return heapq.nlargest(limit, self.discovered_repos, key=self._priority_score)
 
-        sorted_repos = sorted(self.discovered_repos, key=priority_score, reverse=True)
+    @staticmethod
+    def _priority_score(repo: Repository) -> float:
+        """Composite score: stars * activity * issue density."""
+        issue_density = repo.open_issues_count / max(repo.stars, 1)
+        return repo.stars * repo.activity_score * min(issue_density, 1.0)
 
-        return sorted_repos[:limit]
-
-    def get_repositories_by_names(self, repo_names: List[str]) -> List[Repository]:
-        """Get repository data directly from a list of repository names."""
+    def get_repositories_by_names(
+        self, repo_names: List[str], max_workers: int = 10
+    ) -> List[Repository]:
+        """Get repository data directly from a list of repository names in parallel."""
         repositories = []
 
-        with Progress() as progress:
+        with Progress(refresh_per_second=4) as progress:
             task = progress.add_task(
                 "[green]Fetching repositories...", total=len(repo_names)
             )
 
-            for repo_name in repo_names:
-                console.print(f"\n[blue]📋 Fetching {repo_name}...[/blue]")
-
-                try:
-                    # Use GitHub client to get repository data
-                    repo_data_list = self.github.search_repositories(
-                        query=f"repo:{repo_name}", per_page=1
-                    )
-
-                    if repo_data_list:
-                        repo_data = repo_data_list[0]
-                        repo_data["discovered_at"] = datetime.now()
+            # Lookups are independent, so overlap their round-trips
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_name = {
+                    executor.submit(
+                        self._fetch_repository_by_name, repo_name
+                    ): repo_name
+                    for repo_name in repo_names
+                }
 
-                        try:
-                            repo = Repository(**repo_data)
+                for future in as_completed(future_to_name):
+                    repo_name = future_to_name[future]
+                    try:
+                        repo = future.result()
+                        if repo:
                             repositories.append(repo)
-                            console.print(f"  [green]✓[/green] Added {repo_name}")
-                        except Exception as e:
-                            console.print(
-                                f"  [yellow]⚠[/yellow] Could not parse {repo_name}: {e}"
-                            )
-                    else:
-                        console.print(
-                            f"  [red]✗[/red] Repository {repo_name} not found or not accessible"
-                        )
-
-                except Exception as e:
-                    console.print(f"  [red]✗[/red] Error fetching {repo_name}: {e}")
+                    except Exception as e:
+                        console.print(f"  [red]✗[/red] Error fetching {repo_name}: {e}")
 
-                progress.update(task, advance=1)
+                    progress.advance(task)
 
         # Filter repositories using the same criteria
         filtered_repos = self._filter_repositories(repositories)
@@ -389,3 +379,20 @@ class RepositoryDiscoverer:
         )
 
         return filtered_repos
+
+    def _fetch_repository_by_name(self, repo_name: str) -> Optional[Repository]:
+        """Fetch a single repository by name (thread-safe)."""
+        # The repos endpoint draws on the core budget, not the 30/min search one
+        repo_data = self.github.get_repository(repo_name)
+
+        if repo_data is None:
+            console.print(
+                f"  [red]✗[/red] Repository {repo_name} not found or not accessible"
+            )
+            return None
+
+        try:
+            return Repository(**repo_data)
+        except Exception as e:
+            console.print(f"  [yellow]⚠[/yellow] Could not parse {repo_name}: {e}")
+            return None
@@ -1,23 +1,106 @@
 """LLM-based issue assessment and script generation."""
 
+import hashlib
 import os
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 from rich.console import Console
 from rich.progress import Progress
 
 from ..models import Issue, Assessment
+from ..models.issue import BUG_LABELS, DOCS_LABELS, FEATURE_LABELS
+from ..utils.database import DatabaseManager
 
 console = Console()
 
+# Structured output schema for one assessment; providers enforce it, so
+# responses never need to be scraped for JSON
+ASSESSMENT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "index": {
+            "type": "integer",
+            "description": "Bracketed number before the assessed issue",
+        },
+        "complexity_score": {"type": "number"},
+        "clarity_score": {"type": "number"},
+        "scope_score": {"type": "number"},
+        "feasibility_score": {"type": "number"},
+        "overall_score": {"type": "number"},
+        "is_doable": {"type": "boolean"},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+        "estimated_effort_hours": {"type": ["number", "null"]},
+        "required_skills": {"type": "array", "items": {"type": "string"}},
+        "potential_risks": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "index",
+        "complexity_score",
+        "clarity_score",
+        "scope_score",
+        "feasibility_score",
+        "overall_score",
+        "is_doable",
+        "confidence",
+        "reasoning",
+        "estimated_effort_hours",
+        "required_skills",
+        "potential_risks",
+    ],
+    "additionalProperties": False,
+}
+
+# Every request returns a list of assessments, one per issue in the prompt
+ASSESSMENTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"assessments": {"type": "array", "items": ASSESSMENT_SCHEMA}},
+    "required": ["assessments"],
+    "additionalProperties": False,
+}
+
+# Anthropic tool the model is forced to call with its assessments
+ASSESSMENT_TOOL = {
+    "name": "record_assessments",
+    "description": "Record the assessment of each GitHub issue.",
+    "input_schema": ASSESSMENTS_SCHEMA,
+}
+
+# How one issue is presented to the LLM
+ISSUE_TEMPLATE = """Repository: {repo}
+Issue #{number}: {title}
+Labels: {labels}
+Description: {description}"""
+
+# Scores and details requested for every issue
+RATING_INSTRUCTIONS = """1. Complexity (1=very simple, 10=very complex)
+2. Clarity (1=unclear requirements, 10=crystal clear)
+3. Scope (1=tiny change, 10=massive undertaking)
+4. Feasibility (1=impossible, 10=definitely doable)
+
+Also provide:
+- Overall score (1-10)
+- Is this doable? (yes/no)
+- Confidence (0-1)
+- Brief reasoning (2-3 sentences)
+- Estimated effort in hours
+- Required skills (list)
+- Potential risks (list)"""
+
 
 class IssueAssessor:
     """Assesses GitHub issues using LLM and generates TTS scripts."""
 
-    def __init__(self):
+    # Issues per LLM request, and the description characters one request may carry
+    BATCH_SIZE = 5
+    BATCH_BODY_BUDGET = 4096
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
         """Initialize the issue assessor with available LLM clients."""
         self.anthropic_client = None
         self.openai_client = None
+        self.db_manager = db_manager
 
         # Try to initialize Anthropic client
         anthropic_key = os.getenv("ANTHROPIC_API_KEY")
@@ -49,162 +132,296 @@ class IssueAssessor:
             )
 
     def assess_issues(
-        self, issues: List[Issue], max_workers: int = 3
+        self, issues: List[Issue], max_workers: int = 10
     ) -> List[Assessment]:
-        """Assess multiple issues in parallel and return sorted assessments."""
-        assessments = []
+        """Assess issues in batched LLM requests and return sorted assessments."""
+        # Fingerprint each issue once for both the cache lookup and write-back
+        cache_keys = (
+            {issue.id: self._cache_key(issue) for issue in issues}
+            if self.db_manager is not None
+            else {}
+        )
+        assessments, pending = self._load_cached_assessments(issues, cache_keys)
+        if assessments:
+            console.print(
+                f"[blue]ℹ[/blue] Reusing {len(assessments)} cached assessments"
+            )
+
+        new_assessments = []
+        batches = self._batch_issues(pending)
 
         with Progress() as progress:
-            task = progress.add_task("[green]Assessing issues...", total=len(issues))
+            task = progress.add_task("[green]Assessing issues...", total=len(pending))
 
-            # Use ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # LLM calls are pure network waits, so the pool size bounds how
+            # many requests are in flight; never spawn more than there are batches
+            workers = max(1, min(max_workers, len(batches)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
                 # Submit all tasks
-                future_to_issue = {
-                    executor.submit(self._assess_single_issue, issue): issue
-                    for issue in issues
+                future_to_batch = {
+                    executor.submit(self._assess_issue_batch, batch): batch
+                    for batch in batches
                 }
 
                 # Process completed tasks as they finish
-                for future in as_completed(future_to_issue):
-                    issue = future_to_issue[future]
+                for future in as_completed(future_to_batch):
+                    batch = future_to_batch[future]
                     try:
-                        assessment = future.result()
-                        assessments.append(assessment)
-                        console.print(
-                            f"  [green]✓[/green] Assessed #{issue.number}: {assessment.overall_score:.1f}/10"
-                        )
+                        batch_assessments = future.result()
+                        new_assessments.extend(batch_assessments)
+                        for assessment in batch_assessments:
+                            console.print(
+                                f"  [green]✓[/green] Assessed #{assessment.issue_number}: {assessment.overall_score:.1f}/10"
+                            )
                     except Exception as e:
-                        console.print(
-                            f"  [red]✗[/red] Failed to assess #{issue.number}: {e}"
-                        )
+                        numbers = ", ".join(f"#{issue.number}" for issue in batch)
+                        console.print(f"  [red]✗[/red] Failed to assess {numbers}: {e}")
+
+                    progress.update(task, advance=len(batch))
 
-                    progress.update(task, advance=1)
+        self._store_assessments(new_assessments, cache_keys)
+        assessments.extend(new_assessments)
 
         # Sort by composite score (easiest to hardest)
         assessments.sort(key=lambda x: x.composite_score, reverse=True)
         return assessments
 
-    def _assess_single_issue(self, issue: Issue) -> Assessment:
-        """Assess a single issue using the available LLM."""
-        prompt = self._create_assessment_prompt(issue)
+    @property
+    def model_name(self) -> str:
+        """Name recorded on assessments from the active LLM client."""
+        return "claude-3-5-sonnet" if self.anthropic_client else "gpt-4o"
+
+    def _cache_key(self, issue: Issue) -> Tuple[int, int, str, bytes]:
+        """Cache key: issue, its last update, the model, and the exact prompt."""
+        prompt = self._create_assessment_prompt([issue])
+        prompt_sha = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        return (
+            issue.id,
+            int(issue.updated_at.timestamp()),
+            self.model_name,
+            prompt_sha,
+        )
 
+    def _load_cached_assessments(
+        self, issues: List[Issue], keys: Dict[int, Tuple[int, int, str, bytes]]
+    ) -> Tuple[List[Assessment], List[Issue]]:
+        """Split issues into cached assessments and issues still to assess."""
+        if self.db_manager is None:
+            return [], list(issues)
+
+        try:
+            cached = self.db_manager.get_cached_assessments(keys.values())
+        except Exception as e:
+            console.print(
+                f"[yellow]Warning: Assessment cache unavailable: {e}[/yellow]"
+            )
+            return [], list(issues)
+
+        assessments = []
+        pending = []
+        for issue in issues:
+            payload = cached.get(keys[issue.id])
+            if payload is None:
+                pending.append(issue)
+            else:
+                assessments.append(Assessment.model_validate_json(payload))
+
+        return assessments, pending
+
+    def _store_assessments(
+        self,
+        assessments: List[Assessment],
+        keys: Dict[int, Tuple[int, int, str, bytes]],
+    ) -> None:
+        """Cache freshly made assessments."""
+        if self.db_manager is None:
+            return
+
+        rows = []
+        for assessment in assessments:
+            issue_id, updated_at, model, prompt_sha = keys[assessment.issue_id]
+            rows.append(
+                {
+                    "issue_id": issue_id,
+                    "updated_at": updated_at,
+                    "model": model,
+                    "prompt_sha": prompt_sha,
+                    "result_json": assessment.model_dump_json().encode("utf-8"),
+                }
+            )
+
+        try:
+            self.db_manager.put_cached_assessments(rows)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not cache assessments: {e}[/yellow]")
+
+    def _batch_issues(self, issues: List[Issue]) -> List[List[Issue]]:
+        """Group issues into batches bounded by count and description length."""
+        batches: List[List[Issue]] = []
+        batch: List[Issue] = []
+        budget = 0
+
+        for issue in issues:
+            # Prompts include at most 500 characters of each description
+            size = len(issue.body_preview)
+            if batch and (
+                len(batch) >= self.BATCH_SIZE or budget + size > self.BATCH_BODY_BUDGET
+            ):
+                batches.append(batch)
+                batch, budget = [], 0
+            batch.append(issue)
+            budget += size
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _assess_issue_batch(self, issues: List[Issue]) -> List[Assessment]:
+        """Assess issues with one LLM request, retrying any gaps one by one."""
+        try:
+            prompt = self._create_assessment_prompt(issues)
+            items = self._request_assessments(prompt, max_tokens=600 * len(issues))
+            assessments, missing = self._parse_assessments(issues, items)
+        except Exception as e:
+            if len(issues) == 1:
+                raise
+            console.print(
+                f"[yellow]Warning: Batch assessment failed ({e}), assessing individually[/yellow]"
+            )
+            assessments, missing = [], list(issues)
+
+        if missing and len(issues) == 1:
+            raise ValueError("response did not include a valid assessment")
+
+        # Keep what the batch returned; only re-ask for the gaps
+        if missing and assessments:
+            numbers = ", ".join(f"#{issue.number}" for issue in missing)
+            console.print(
+                f"[yellow]Warning: Batch response skipped {numbers}, assessing individually[/yellow]"
+            )
+        for issue in missing:
+            try:
+                assessments.extend(self._assess_issue_batch([issue]))
+            except Exception as e:
+                console.print(f"  [red]✗[/red] Failed to assess #{issue.number}: {e}")
+
+        return assessments
+
+    def _request_assessments(
+        self, prompt: str, max_tokens: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Ask whichever LLM client is available for structured assessments."""
         if self.anthropic_client:
-            response = self._call_anthropic(prompt)
-        elif self.openai_client:
-            response = self._call_openai(prompt)
-        else:
-            raise ValueError("No LLM client available")
+            return self._call_anthropic(prompt, max_tokens)
+        if self.openai_client:
+            return self._call_openai(prompt, max_tokens)
+        raise ValueError("No LLM client available")
+
+    @staticmethod
+    def _format_issue(issue: Issue) -> str:
+        """Render one issue for a prompt, with at most 500 description characters."""
+        return ISSUE_TEMPLATE.format_map(
+            {
+                "repo": issue.repo_full_name,
+                "number": issue.number,
+                "title": issue.title,
+                "labels": ", ".join(issue.labels),
+                "description": issue.body_preview or "No description",
+            }
+        )
 
-        return self._parse_assessment_response(issue, response)
+    def _create_assessment_prompt(self, issues: List[Issue]) -> str:
+        """Create one assessment prompt covering one or more issues."""
+        issue_blocks = "\n\n".join(
+            f"[{index}] {self._format_issue(issue)}"
+            for index, issue in enumerate(issues, 1)
+        )
+        subject = (
+            "this GitHub issue"
+            if len(issues) == 1
+            else f"each of these {len(issues)} GitHub issues"
+        )
 
-    def _create_assessment_prompt(self, issue: Issue) -> str:
-        """Create assessment prompt for the LLM."""
         return f"""
-Assess this GitHub issue for difficulty and feasibility. Provide scores from 1-10:
+Assess {subject} for difficulty and feasibility. Provide scores from 1-10:
 
-Repository: {issue.repo_full_name}
-Issue #{issue.number}: {issue.title}
-Labels: {", ".join(issue.labels)}
-Description: {issue.body[:500] if issue.body else "No description"}
+{issue_blocks}
 
-Please rate:
-1. Complexity (1=very simple, 10=very complex)
-2. Clarity (1=unclear requirements, 10=crystal clear)
-3. Scope (1=tiny change, 10=massive undertaking)
-4. Feasibility (1=impossible, 10=definitely doable)
+For each issue, rate:
+{RATING_INSTRUCTIONS}
 
-Also provide:
-- Overall score (1-10)
-- Is this doable? (yes/no)
-- Confidence (0-1)
-- Brief reasoning (2-3 sentences)
-- Estimated effort in hours
-- Required skills (list)
-- Potential risks (list)
-
-Respond in this exact JSON format:
-{{
-    "complexity_score": 5.0,
-    "clarity_score": 8.0,
-    "scope_score": 3.0,
-    "feasibility_score": 7.0,
-    "overall_score": 6.0,
-    "is_doable": true,
-    "confidence": 0.8,
-    "reasoning": "This is a straightforward bug fix with clear reproduction steps.",
-    "estimated_effort_hours": 4.0,
-    "required_skills": ["Python", "Testing"],
-    "potential_risks": ["Breaking existing functionality"]
-}}
+Return one assessment per issue, where "index" is the bracketed number
+before the issue.
 """
 
-    def _call_anthropic(self, prompt: str) -> str:
-        """Call Anthropic Claude API."""
+    def _call_anthropic(
+        self, prompt: str, max_tokens: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Call Anthropic Claude API, forcing the assessment tool."""
         response = self.anthropic_client.messages.create(
             model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
+            max_tokens=max_tokens,
+            tools=[ASSESSMENT_TOOL],
+            tool_choice={"type": "tool", "name": ASSESSMENT_TOOL["name"]},
             messages=[{"role": "user", "content": prompt}],
         )
-        return response.content[0].text
+        tool_use = next(block for block in response.content if block.type == "tool_use")
+        return tool_use.input["assessments"]
 
-    def _call_openai(self, prompt: str) -> str:
-        """Call OpenAI GPT API."""
+    def _call_openai(self, prompt: str, max_tokens: int = 1000) -> List[Dict[str, Any]]:
+        """Call OpenAI GPT API with a strict JSON schema response."""
         response = self.openai_client.chat.completions.create(
-            model="gpt-4",
+            model="gpt-4o",
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=1000,
+            max_tokens=max_tokens,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "assessments",
+                    "schema": ASSESSMENTS_SCHEMA,
+                    "strict": True,
+                },
+            },
         )
-        return response.choices[0].message.content
+        return orjson.loads(response.choices[0].message.content)["assessments"]
 
-    def _parse_assessment_response(self, issue: Issue, response: str) -> Assessment:
-        """Parse LLM response into Assessment object."""
-        import json
+    def _parse_assessments(
+        self, issues: List[Issue], items: List[Dict[str, Any]]
+    ) -> Tuple[List[Assessment], List[Issue]]:
+        """Match structured assessments to issues; return (assessments, missing)."""
+        # Issue numbers can repeat across repositories, so match on position
+        by_index = {item.get("index"): item for item in items}
 
-        try:
-            # Extract JSON from response
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            json_str = response[start:end]
-
-            data = json.loads(json_str)
-
-            return Assessment(
-                issue_id=issue.id,
-                issue_number=issue.number,
-                repo_full_name=issue.repo_full_name,
-                complexity_score=data["complexity_score"],
-                clarity_score=data["clarity_score"],
-                scope_score=data["scope_score"],
-                feasibility_score=data["feasibility_score"],
-                overall_score=data["overall_score"],
-                is_doable=data["is_doable"],
-                confidence=data["confidence"],
-                reasoning=data["reasoning"],
-                estimated_effort_hours=data.get("estimated_effort_hours"),
-                required_skills=data.get("required_skills", []),
-                potential_risks=data.get("potential_risks", []),
-                model_used="claude-3-5-sonnet" if self.anthropic_client else "gpt-4",
-            )
-        except (json.JSONDecodeError, KeyError) as e:
-            console.print(
-                f"[yellow]Warning: Failed to parse assessment response: {e}[/yellow]"
-            )
-            # Return default assessment
-            return Assessment(
-                issue_id=issue.id,
-                issue_number=issue.number,
-                repo_full_name=issue.repo_full_name,
-                complexity_score=5.0,
-                clarity_score=5.0,
-                scope_score=5.0,
-                feasibility_score=5.0,
-                overall_score=5.0,
-                is_doable=True,
-                confidence=0.5,
-                reasoning="Could not parse detailed assessment",
-                model_used="fallback",
-            )
+        assessments = []
+        missing = []
+        for index, issue in enumerate(issues, 1):
+            try:
+                assessments.append(self._build_assessment(issue, by_index[index]))
+            except (KeyError, TypeError, ValueError):
+                # Absent or out-of-range entries are retried on their own
+                missing.append(issue)
+
+        return assessments, missing
+
+    def _build_assessment(self, issue: Issue, data: Dict[str, Any]) -> Assessment:
+        """Build an Assessment from one parsed JSON object."""
+        return Assessment(
+            issue_id=issue.id,
+            issue_number=issue.number,
+            repo_full_name=issue.repo_full_name,
+            complexity_score=data["complexity_score"],
+            clarity_score=data["clarity_score"],
+            scope_score=data["scope_score"],
+            feasibility_score=data["feasibility_score"],
+            overall_score=data["overall_score"],
+            is_doable=data["is_doable"],
+            confidence=data["confidence"],
+            reasoning=data["reasoning"],
+            estimated_effort_hours=data.get("estimated_effort_hours"),
+            required_skills=data.get("required_skills", []),
+            potential_risks=data.get("potential_risks", []),
+            model_used=self.model_name,
+        )
 
     def generate_audio_script(
         self, issues: List[Issue], assessments: List[Assessment]
@@ -220,27 +437,14 @@ Respond in this exact JSON format:
             if issue.id in assessment_map:
                 assessment = assessment_map[issue.id]
 
-                # Determine difficulty level
-                composite_score = assessment.composite_score
-                if composite_score >= 7.0:
-                    difficulty = "Easy"
-                elif composite_score >= 5.0:
-                    difficulty = "Medium"
-                else:
-                    difficulty = "Hard"
-
                 # Determine issue type from labels
+                issue_labels = issue.normalized_labels
                 issue_type = "Enhancement"
-                if any(label.lower() in ["bug", "bugfix"] for label in issue.labels):
+                if not issue_labels.isdisjoint(BUG_LABELS):
                     issue_type = "Bug"
-                elif any(
-                    label.lower() in ["feature", "enhancement"]
-                    for label in issue.labels
-                ):
+                elif not issue_labels.isdisjoint(FEATURE_LABELS):
                     issue_type = "Feature"
-                elif any(
-                    label.lower() in ["documentation", "docs"] for label in issue.labels
-                ):
+                elif not issue_labels.isdisjoint(DOCS_LABELS):
                     issue_type = "Documentation"
 
                 issue_data.append(
@@ -251,11 +455,9 @@ Respond in this exact JSON format:
                         ],  # Just repo name
                         "issue_type": issue_type,
                         "title": issue.title,
-                        "description": issue.body[:200] + "..."
-                        if issue.body and len(issue.body) > 200
-                        else issue.body or "No description provided",
-                        "difficulty": difficulty,
-                        "composite_score": composite_score,
+                        "description": issue.short_description,
+                        "difficulty": assessment.difficulty,
+                        "composite_score": assessment.composite_score,
                     }
                 )
 
@@ -1,7 +1,19 @@
+from bisect import bisect_right
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field
 
+# Composite score weights (complexity is inverted: lower is better)
+FEASIBILITY_WEIGHT = 0.3
+CLARITY_WEIGHT = 0.25
+COMPLEXITY_WEIGHT = 0.25
+SCOPE_WEIGHT = 0.2
+
+# Composite score cut-offs: below 5 is Hard, below 7 is Medium, else Easy
+DIFFICULTY_THRESHOLDS = (5.0, 7.0)
+DIFFICULTY_LEVELS = ("Hard", "Medium", "Easy")
+
 
 class Assessment(BaseModel):
     """LLM assessment result for an issue."""
@@ -32,26 +44,26 @@ class Assessment(BaseModel):
     model_used: str = "claude-3-5-sonnet"
     assessment_version: str = "1.0"
 
-    @property
+    @cached_property
     def composite_score(self) -> float:
-        """Calculate weighted composite score."""
-        weights = {
-            "feasibility": 0.3,
-            "clarity": 0.25,
-            "complexity": 0.25,  # Lower complexity is better
-            "scope": 0.2,
-        }
-
+        """Calculate weighted composite score (computed once per assessment)."""
         # Invert complexity score (lower complexity = higher score)
         adjusted_complexity = 11 - self.complexity_score
 
         return (
-            weights["feasibility"] * self.feasibility_score
-            + weights["clarity"] * self.clarity_score
-            + weights["complexity"] * adjusted_complexity
-            + weights["scope"] * self.scope_score
+            FEASIBILITY_WEIGHT * self.feasibility_score
+            + CLARITY_WEIGHT * self.clarity_score
+            + COMPLEXITY_WEIGHT * adjusted_complexity
+            + SCOPE_WEIGHT * self.scope_score
         )
 
+    @property
+    def difficulty(self) -> str:
+        """Difficulty label derived from the composite score."""
+        return DIFFICULTY_LEVELS[
+            bisect_right(DIFFICULTY_THRESHOLDS, self.composite_score)
+        ]
+
     class Config:
         populate_by_name = True
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -1,10 +1,61 @@
+import sys
+import time
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from functools import cached_property
 from typing import Optional, List
-from pydantic import BaseModel, Field, HttpUrl
-
-
-class IssueStatus(str, Enum):
+from pydantic import BaseModel, Field
+
+
+def normalize_label(label: str) -> str:
+    """Canonical label form so "good-first-issue" and "Good First Issue" match."""
+    # Interned so set lookups against the label constants short-circuit on identity
+    return sys.intern(label.lower().replace("-", " ").strip())
+
+
+# Candidate label sets, normalized once at import
+GOOD_CANDIDATE_LABELS = frozenset(
+    normalize_label(label)
+    for label in (
+        "good first issue",
+        "good-first-issue",
+        "beginner",
+        "easy",
+        "bug",
+        "enhancement",
+        "feature",
+        "help wanted",
+    )
+)
+
+BAD_CANDIDATE_LABELS = frozenset(
+    normalize_label(label)
+    for label in (
+        "wontfix",
+        "invalid",
+        "duplicate",
+        "question",
+        "discussion",
+        "needs-design",
+        "breaking-change",
+    )
+)
+
+# Issue type label sets, in normalized form
+BUG_LABELS = frozenset({"bug", "bugfix"})
+FEATURE_LABELS = frozenset({"feature", "enhancement"})
+DOCS_LABELS = frozenset({"documentation", "docs"})
+
+# Priority score label tiers
+HIGH_PRIORITY_LABELS = frozenset(
+    normalize_label(label) for label in ("bug", "critical", "urgent")
+)
+MEDIUM_PRIORITY_LABELS = frozenset(
+    normalize_label(label) for label in ("enhancement", "feature", "good first issue")
+)
+
+
+class IssueStatus(StrEnum):
     """Issue processing status."""
 
     DISCOVERED = "discovered"
@@ -25,7 +76,7 @@ class Issue(BaseModel):
     number: int
     title: str
     body: Optional[str] = None
-    html_url: HttpUrl
+    html_url: str  # Comes from the GitHub API, so not re-validated
     state: str  # "open" or "closed"
     labels: List[str] = Field(default_factory=list)
     assignee: Optional[str] = None
@@ -47,65 +98,63 @@ class Issue(BaseModel):
     @property
     def is_good_candidate(self) -> bool:
         """Check if issue is a good candidate for automated fixing."""
-        good_labels = {
-            "good first issue",
-            "good-first-issue",
-            "beginner",
-            "easy",
-            "bug",
-            "enhancement",
-            "feature",
-            "help wanted",
-        }
-
-        bad_labels = {
-            "wontfix",
-            "invalid",
-            "duplicate",
-            "question",
-            "discussion",
-            "needs-design",
-            "breaking-change",
-        }
-
-        # Convert labels to lowercase for comparison
-        issue_labels = {label.lower() for label in self.labels}
+        issue_labels = self.normalized_labels
 
         return (
             self.state == "open"
             and not self.assignees  # Not already assigned
-            and len(issue_labels & good_labels) > 0  # Has good labels
-            and len(issue_labels & bad_labels) == 0  # No bad labels
+            and not issue_labels.isdisjoint(GOOD_CANDIDATE_LABELS)  # Has good labels
+            and issue_labels.isdisjoint(BAD_CANDIDATE_LABELS)  # No bad labels
             and self.comments <= 10  # Not overly discussed
             and bool(self.title)  # Has a title
             and (len(self.body) >= 50 if self.body else True)  # Reasonable description
         )
 
-    @property
+    @cached_property
+    def normalized_labels(self) -> frozenset:
+        """Labels in canonical form, computed once per issue."""
+        return frozenset(normalize_label(label) for label in self.labels)
+
+    @cached_property
+    def short_title(self) -> str:
+        """Title truncated to 50 characters for tables and previews."""
+        return self.title[:47] + "..." if len(self.title) > 50 else self.title
+
+    @cached_property
+    def body_preview(self) -> str:
+        """First 500 characters of the body, as sent to the LLM ("" if none)."""
+        return self.body[:500] if self.body else ""
+
+    @cached_property
+    def short_description(self) -> str:
+        """Body truncated to 200 characters for audio scripts."""
+        if not self.body:
+            return "No description provided"
+        return self.body[:200] + "..." if len(self.body) > 200 else self.body
+
+    @cached_property
     def age_days(self) -> int:
-        """Age of issue in days."""
-        return (datetime.now() - self.created_at.replace(tzinfo=None)).days
+        """Age of issue in days, fixed at first access."""
+        return int((time.time() - self.created_at.timestamp()) // 86400)
 
-    @property
+    @cached_property
     def priority_score(self) -> float:
         """Calculate priority score (0-1) based on various factors."""
         score = 0.5  # Base score
 
         # Label-based scoring
-        high_priority_labels = {"bug", "critical", "urgent"}
-        medium_priority_labels = {"enhancement", "feature", "good first issue"}
-
-        issue_labels = {label.lower() for label in self.labels}
+        issue_labels = self.normalized_labels
 
-        if issue_labels & high_priority_labels:
+        if not issue_labels.isdisjoint(HIGH_PRIORITY_LABELS):
             score += 0.3
-        elif issue_labels & medium_priority_labels:
+        elif not issue_labels.isdisjoint(MEDIUM_PRIORITY_LABELS):
             score += 0.2
 
         # Age-based scoring (newer issues get slight boost)
-        if self.age_days <= 7:
+        age_days = self.age_days
+        if age_days <= 7:
             score += 0.1
-        elif self.age_days <= 30:
+        elif age_days <= 30:
             score += 0.05
 
         # Comment activity (some discussion is good, too much isn't)
@@ -118,4 +167,4 @@ class Issue(BaseModel):
 
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat(), HttpUrl: str}
+        json_encoders = {datetime: lambda v: v.isoformat()}
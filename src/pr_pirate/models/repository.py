@@ -1,6 +1,11 @@
+import time
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
+
+# Languages a repository must use to count as viable
+VIABLE_LANGUAGES = frozenset({"Python", "JavaScript", "TypeScript", "Go", "Rust"})
 
 
 class Repository(BaseModel):
@@ -10,7 +15,7 @@ class Repository(BaseModel):
     name: str
     full_name: str
     description: Optional[str] = None
-    html_url: HttpUrl
+    html_url: str  # Comes from the GitHub API, so not re-validated
     stars: int = Field(alias="stargazers_count")
     forks: int = Field(alias="forks_count")
     language: Optional[str] = None
@@ -33,16 +38,16 @@ class Repository(BaseModel):
             and not self.disabled
             and self.stars >= 10  # Minimum star threshold
             and self.open_issues_count > 0
-            and self.language in {"Python", "JavaScript", "TypeScript", "Go", "Rust"}
+            and self.language in VIABLE_LANGUAGES
         )
 
-    @property
+    @cached_property
     def activity_score(self) -> float:
         """Calculate repository activity score (0-1)."""
         if not self.pushed_at:
             return 0.0
 
-        days_since_push = (datetime.now() - self.pushed_at.replace(tzinfo=None)).days
+        days_since_push = int((time.time() - self.pushed_at.timestamp()) // 86400)
 
         # Fresh repos score higher
         if days_since_push <= 7:
@@ -56,4 +61,4 @@ class Repository(BaseModel):
 
     class Config:
         populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat(), HttpUrl: str}
+        json_encoders = {datetime: lambda v: v.isoformat()}
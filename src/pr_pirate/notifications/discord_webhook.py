@@ -1,17 +1,108 @@
 """Discord webhook notifications for PR Pirate progress and results."""
 
+import io
+import mimetypes
 import os
+import random
+import time
+import uuid
+import orjson
 import requests
-from typing import List, Optional
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, List, Optional
 from datetime import datetime
-from pathlib import Path
 
 from ..models import Issue, Assessment
+from ..models.issue import BUG_LABELS, DOCS_LABELS
+
+# Markdown characters escaped in issue titles, applied in one translate pass
+_DISCORD_ESCAPES = str.maketrans({c: "\\" + c for c in "`*_~"})
+
+# Embed badge for each Assessment.difficulty level
+_DIFFICULTY_BADGES = {"Easy": "🟢 Easy", "Medium": "🟡 Medium", "Hard": "🔴 Hard"}
+
+
+def _utc_now_str() -> str:
+    """Current time for embed fields, in UTC as the label says."""
+    return time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+
+
+class _MultipartBody:
+    """File-like multipart/form-data body that reads the upload from disk.
+
+    ``__len__`` gives requests a real Content-Length, so the body goes out
+    un-chunked, while ``read`` keeps memory flat for large files.
+    """
+
+    def __init__(self, fields: dict, file_field: str, file_path: str):
+        boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        head = b"".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+            for name, value in fields.items()
+        )
+        head += (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._length = len(head) + os.path.getsize(file_path) + len(tail)
+        self._parts = [io.BytesIO(head), open(file_path, "rb"), io.BytesIO(tail)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to ``size`` bytes (all remaining if negative)."""
+        if size is None or size < 0:
+            size = self._length
+        out = bytearray()
+        while self._parts and len(out) < size:
+            chunk = self._parts[0].read(size - len(out))
+            if chunk:
+                out += chunk
+            else:
+                self._parts.pop(0).close()
+        return bytes(out)
+
+    def close(self) -> None:
+        """Release the open upload file."""
+        for part in self._parts:
+            part.close()
+        self._parts = []
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled session so repeated webhook posts reuse one connection."""
+    session = requests.Session()
+    # Only failed connects are retried here (nothing was sent yet); 429s and
+    # 5xx are retried by DiscordNotifier._post
+    retry = Retry(connect=3, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
 
 
 class DiscordNotifier:
     """Send notifications to Discord via webhook."""
 
+    # Discord's attachment limit for webhooks
+    MAX_FILE_SIZE = 8 * 1024 * 1024
+
+    # Attempts per post, and the full-jitter backoff bounds for 5xx responses
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+
     def __init__(self):
         """Initialize Discord webhook notifier."""
         self.webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
@@ -20,26 +111,89 @@ class DiscordNotifier:
             and self.webhook_url
             != "https://discord.com/api/webhooks/your_webhook_url_here"
         )
+        self._session = _create_session()
+        # Webhook posts are off the critical path; flush() waits for them
+        self._executor = ThreadPoolExecutor(max_workers=2)
 
-    def send_message(self, content: str, embed: Optional[dict] = None) -> bool:
-        """Send a message to Discord webhook."""
-        if not self.enabled:
-            return False
+    def _post(self, error_prefix: str, build_request: Callable[[], dict]) -> bool:
+        """POST to the webhook in the background, retrying 429s and 5xx.
 
+        ``build_request`` returns fresh ``requests`` kwargs per attempt, since
+        a streamed body cannot be replayed. Returns whether the post succeeded.
+        """
         try:
-            payload = {"content": content}
-            if embed:
-                payload["embeds"] = [embed]
-
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
+            for attempt in range(self.MAX_RETRIES):
+                request_kwargs = build_request()
+                try:
+                    response = self._session.post(self.webhook_url, **request_kwargs)
+                finally:
+                    # File bodies hold an open handle until closed
+                    data = request_kwargs.get("data")
+                    if hasattr(data, "close"):
+                        data.close()
+                delay = self._retry_delay(response, attempt)
+                if delay is None or attempt == self.MAX_RETRIES - 1:
+                    break
+                time.sleep(delay)
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Failed to send Discord notification: {e}")
+            print(f"{error_prefix}: {e}")
+            return False
+
+    def _retry_delay(
+        self, response: requests.Response, attempt: int
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a response, or None if it is final."""
+        if response.status_code == 429:
+            # Discord reports retry_after (seconds, float) in the body and header
+            try:
+                retry_after = float(response.json()["retry_after"])
+            except Exception:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            # Jitter keeps concurrent notifications from retrying in lockstep
+            return retry_after + random.uniform(0, 0.5)
+
+        if response.status_code >= 500:
+            cap = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt)
+            return cap * random.uniform(0.5, 1.0)
+
+        return None
+
+    def flush(self) -> None:
+        """Wait for queued notifications to finish sending."""
+        self._executor.shutdown(wait=True)
+        # A fresh pool keeps the notifier usable after a flush
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def send_message(self, content: str, embed: Optional[dict] = None) -> bool:
+        """Queue a message for the Discord webhook."""
+        if not self.enabled:
             return False
 
+        payload = {"content": content}
+        if embed:
+            payload["embeds"] = [embed]
+
+        # Compact UTF-8 JSON: requests' json= pads separators and escapes
+        # every emoji to a 12-byte surrogate pair
+        body = orjson.dumps(payload)
+        self._executor.submit(
+            self._post,
+            "Failed to send Discord notification",
+            lambda: {
+                "data": body,
+                "headers": {"Content-Type": "application/json"},
+                "timeout": 10,
+            },
+        )
+        return True
+
     def send_start_notification(self, categories: List[str], repo_count: int) -> bool:
         """Send notification when PR Pirate starts."""
+        if not self.enabled:
+            return False
+
         embed = {
             "title": "📻 RepoRadio Started",
             "description": "Beginning GitHub issue discovery and analysis",
@@ -57,7 +211,7 @@ class DiscordNotifier:
                 },
                 {
                     "name": "⏰ Started",
-                    "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                    "value": _utc_now_str(),
                     "inline": False,
                 },
             ],
@@ -72,18 +226,22 @@ class DiscordNotifier:
         self, issues: List[Issue], assessments: List[Assessment]
     ) -> bool:
         """Send LLM assessment results for top 10 issues."""
-        if not issues or not assessments:
+        if not self.enabled or not issues or not assessments:
             return False
 
-        # Create assessment map
-        assessment_map = {a.issue_id: a for a in assessments}
+        # Map only the assessments for the top 10 issues, not all of them
+        top_issues = issues[:10]
+        wanted_ids = {issue.id for issue in top_issues}
+        assessment_map = {
+            a.issue_id: a for a in assessments if a.issue_id in wanted_ids
+        }
 
         # Create issue-assessment pairs and sort by composite score (highest to lowest = easiest to hardest)
-        issue_assessment_pairs = []
-        for issue in issues[:10]:
-            if issue.id in assessment_map:
-                assessment = assessment_map[issue.id]
-                issue_assessment_pairs.append((issue, assessment))
+        issue_assessment_pairs = [
+            (issue, assessment_map[issue.id])
+            for issue in top_issues
+            if issue.id in assessment_map
+        ]
 
         # Sort by composite score (descending = easiest first)
         issue_assessment_pairs.sort(key=lambda x: x[1].composite_score, reverse=True)
@@ -91,27 +249,20 @@ class DiscordNotifier:
         # Build results list (properly sorted by difficulty)
         results = []
         for i, (issue, assessment) in enumerate(issue_assessment_pairs, 1):
-            difficulty = (
-                "🟢 Easy"
-                if assessment.composite_score >= 7.0
-                else "🟡 Medium"
-                if assessment.composite_score >= 5.0
-                else "🔴 Hard"
-            )
+            difficulty = _DIFFICULTY_BADGES[assessment.difficulty]
 
             # Determine issue type emoji
+            issue_labels = issue.normalized_labels
             issue_type = "🔧 Enhancement"
-            if any(label.lower() in ["bug", "bugfix"] for label in issue.labels):
+            if not issue_labels.isdisjoint(BUG_LABELS):
                 issue_type = "🐛 Bug"
-            elif any(label.lower() in ["feature"] for label in issue.labels):
+            elif "feature" in issue_labels:
                 issue_type = "✨ Feature"
-            elif any(
-                label.lower() in ["documentation", "docs"] for label in issue.labels
-            ):
+            elif not issue_labels.isdisjoint(DOCS_LABELS):
                 issue_type = "📚 Docs"
 
             # Sanitize title to prevent Discord markdown issues
-            title_clean = issue.title.replace("`", "\\`")  # Escape backticks
+            title_clean = issue.title.translate(_DISCORD_ESCAPES)
             title_short = (
                 title_clean[:50] + "..." if len(title_clean) > 50 else title_clean
             )
@@ -145,12 +296,15 @@ class DiscordNotifier:
                 }
             )
 
+        # Tally difficulty buckets in a single pass
+        counts = Counter(assessment.difficulty for assessment in assessments)
+
         embed["fields"].append(
             {
                 "name": "📊 Assessment Stats",
-                "value": f"🟢 Easy: {sum(1 for a in assessments if a.composite_score >= 7.0)} issues\n"
-                f"🟡 Medium: {sum(1 for a in assessments if 5.0 <= a.composite_score < 7.0)} issues\n"
-                f"🔴 Hard: {sum(1 for a in assessments if a.composite_score < 5.0)} issues",
+                "value": f"🟢 Easy: {counts['Easy']} issues\n"
+                f"🟡 Medium: {counts['Medium']} issues\n"
+                f"🔴 Hard: {counts['Hard']} issues",
                 "inline": True,
             }
         )
@@ -166,9 +320,12 @@ class DiscordNotifier:
         drive_link: Optional[str] = None,
     ) -> bool:
         """Send notification when audio generation is complete."""
+        if not self.enabled:
+            return False
+
         file_size = "Unknown"
         try:
-            size_bytes = Path(audio_path).stat().st_size
+            size_bytes = os.path.getsize(audio_path)
             file_size = (
                 f"{size_bytes / (1024 * 1024):.1f} MB"
                 if size_bytes > 1024 * 1024
@@ -218,6 +375,9 @@ class DiscordNotifier:
 
     def send_error_notification(self, error_message: str, stage: str) -> bool:
         """Send error notification."""
+        if not self.enabled:
+            return False
+
         embed = {
             "title": "❌ RepoRadio Error",
             "description": f"An error occurred during {stage}",
@@ -231,7 +391,7 @@ class DiscordNotifier:
                 {"name": "📍 Stage", "value": stage, "inline": True},
                 {
                     "name": "⏰ Time",
-                    "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                    "value": _utc_now_str(),
                     "inline": True,
                 },
             ],
@@ -239,24 +399,41 @@ class DiscordNotifier:
 
         return self.send_message("🚨 **RepoRadio encountered an error**", embed)
 
-    def send_file(self, file_path: str, message: str = "") -> bool:
-        """Send a file to Discord (for audio files)."""
+    def send_file(self, file_path: str, message: str = "") -> Optional[Future]:
+        """Queue a file for Discord (for audio files), streaming it from disk.
+
+        Returns None if the file can't be sent, otherwise a future that
+        resolves to whether the upload succeeded.
+        """
         if not self.enabled:
-            return False
+            return None
 
         try:
-            with open(file_path, "rb") as f:
-                files = {"file": f}
-                data = {"content": message} if message else {}
-
-                response = requests.post(
-                    self.webhook_url, data=data, files=files, timeout=30
-                )
-                response.raise_for_status()
-                return True
-        except Exception as e:
+            file_size = os.path.getsize(file_path)
+        except OSError as e:
             print(f"Failed to send file to Discord: {e}")
-            return False
+            return None
+
+        if file_size >= self.MAX_FILE_SIZE:
+            print(
+                f"Skipping Discord upload: {file_path} is {file_size} bytes "
+                f"(limit {self.MAX_FILE_SIZE})"
+            )
+            return None
+
+        fields = {"content": message} if message else {}
+
+        def build_request() -> dict:
+            body = _MultipartBody(fields, "file", file_path)
+            return {
+                "data": body,
+                "headers": {"Content-Type": body.content_type},
+                "timeout": 30,
+            }
+
+        return self._executor.submit(
+            self._post, "Failed to send file to Discord", build_request
+        )
 
     def is_enabled(self) -> bool:
         """Check if Discord notifications are enabled."""
@@ -1,7 +1,7 @@
 """Google Drive integration for uploading audio files."""
 
 import os
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 from rich.console import Console
@@ -9,9 +9,33 @@ from rich.console import Console
 console = Console()
 
 
+@lru_cache(maxsize=4)
+def _build_drive_service(credentials_path: str):
+    """Build a Drive v3 service once per credentials file."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
+    # Load service account credentials
+    credentials = service_account.Credentials.from_service_account_file(
+        credentials_path, scopes=["https://www.googleapis.com/auth/drive.file"]
+    )
+
+    # The bundled discovery document avoids a network fetch and file cache
+    return build(
+        "drive",
+        "v3",
+        credentials=credentials,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
 class GoogleDriveUploader:
     """Upload files to Google Drive using service account."""
 
+    # Files above this size use a resumable upload session
+    RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
     def __init__(self):
         """Initialize Google Drive uploader."""
         self.credentials_path = os.getenv("GOOGLE_DRIVE_CREDENTIALS_PATH")
@@ -31,16 +55,7 @@ class GoogleDriveUploader:
 
     def _initialize_service(self):
         """Initialize Google Drive service."""
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-
-        # Load service account credentials
-        credentials = service_account.Credentials.from_service_account_file(
-            self.credentials_path, scopes=["https://www.googleapis.com/auth/drive.file"]
-        )
-
-        # Build the service
-        self.service = build("drive", "v3", credentials=credentials)
+        self.service = _build_drive_service(self.credentials_path)
 
     def upload_file(self, file_path: str, description: str = "") -> Optional[str]:
         """Upload a file to Google Drive and return shareable link."""
@@ -50,8 +65,8 @@ class GoogleDriveUploader:
         try:
             from googleapiclient.http import MediaFileUpload
 
-            file_name = Path(file_path).name
-            file_size = Path(file_path).stat().st_size
+            file_name = os.path.basename(file_path)
+            file_size = os.stat(file_path).st_size
 
             console.print(
                 f"[blue]☁️ Uploading {file_name} to Google Drive ({file_size / (1024 * 1024):.1f} MB)...[/blue]"
@@ -64,8 +79,11 @@ class GoogleDriveUploader:
                 "parents": [self.folder_id] if self.folder_id else [],
             }
 
-            # Upload the file
-            media = MediaFileUpload(file_path, resumable=True)
+            # Small files go up in one multipart request; the resumable
+            # protocol's extra session round-trips only pay off for large ones
+            media = MediaFileUpload(
+                file_path, resumable=file_size > self.RESUMABLE_THRESHOLD
+            )
             file = (
                 self.service.files()
                 .create(
@@ -79,17 +97,11 @@ class GoogleDriveUploader:
                 fileId=file["id"], body={"role": "reader", "type": "anyone"}
             ).execute()
 
-            # Get the shareable link
-            file_info = (
-                self.service.files()
-                .get(fileId=file["id"], fields="webViewLink,webContentLink")
-                .execute()
-            )
-
+            # The create response already carries the shareable link
             console.print(
-                f"[green]✓[/green] Uploaded to Google Drive: {file_info['webViewLink']}"
+                f"[green]✓[/green] Uploaded to Google Drive: {file['webViewLink']}"
             )
-            return file_info["webViewLink"]
+            return file["webViewLink"]
 
         except Exception as e:
             console.print(f"[red]✗[/red] Failed to upload to Google Drive: {e}")
@@ -2,54 +2,54 @@
 
 from typing import List, Dict, Any
 
+INTRO_TEMPLATE = """
+Welcome to your GitHub Issues Summary! 
+I've discovered {total_issues} interesting issues from various repositories, 
+and I've ranked them from easiest to hardest based on complexity, clarity, and scope. 
+Let's dive into these opportunities to contribute to open source projects.
+"""
+
+ISSUE_TEMPLATE = """
+Issue {number} of 10. 
+Repository: {repo_name}. 
+Type: {issue_type}. 
+Title: {title}. 
+Description: {description}. 
+Difficulty Level: {difficulty}.
+"""
+
+OUTRO = """
+That concludes your GitHub Issues Summary! 
+These issues are sorted from easiest to hardest, so you might want to start with the first few. 
+Remember to read the full issue descriptions and repository contribution guidelines before diving in. 
+Happy coding!
+"""
+
 
 class AudioScriptTemplate:
     """Generates TTS-friendly scripts from issue data."""
 
     def generate_script(self, issues_data: List[Dict[str, Any]]) -> str:
         """Generate a complete audio script from issue data."""
-        script_parts = []
-
-        # Introduction
-        script_parts.append(self._generate_intro(len(issues_data)))
-
-        # Issue summaries
-        for issue in issues_data:
-            script_parts.append(self._generate_issue_summary(issue))
-
-        # Conclusion
-        script_parts.append(self._generate_outro())
-
-        return " ".join(script_parts)
+        return " ".join(
+            [
+                self._generate_intro(len(issues_data)),
+                *[self._generate_issue_summary(issue) for issue in issues_data],
+                self._generate_outro(),
+            ]
+        )
 
     def _generate_intro(self, total_issues: int) -> str:
         """Generate introduction text."""
-        return f"""
-Welcome to your GitHub Issues Summary! 
-I've discovered {total_issues} interesting issues from various repositories, 
-and I've ranked them from easiest to hardest based on complexity, clarity, and scope. 
-Let's dive into these opportunities to contribute to open source projects.
-"""
+        return INTRO_TEMPLATE.format(total_issues=total_issues)
 
     def _generate_issue_summary(self, issue: Dict[str, Any]) -> str:
         """Generate summary text for a single issue."""
-        return f"""
-Issue {issue["number"]} of 10. 
-Repository: {issue["repo_name"]}. 
-Type: {issue["issue_type"]}. 
-Title: {issue["title"]}. 
-Description: {issue["description"]}. 
-Difficulty Level: {issue["difficulty"]}.
-"""
+        return ISSUE_TEMPLATE.format_map(issue)
 
     def _generate_outro(self) -> str:
         """Generate conclusion text."""
-        return """
-That concludes your GitHub Issues Summary! 
-These issues are sorted from easiest to hardest, so you might want to start with the first few. 
-Remember to read the full issue descriptions and repository contribution guidelines before diving in. 
-Happy coding!
-"""
+        return OUTRO
 
     def generate_preview_text(self, issues_data: List[Dict[str, Any]]) -> str:
         """Generate a short preview of the script for display."""
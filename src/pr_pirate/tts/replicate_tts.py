@@ -1,9 +1,13 @@
 """Replicate TTS integration using Kokoro model."""
 
 import os
+import shutil
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 console = Console()
 
@@ -20,6 +24,7 @@ class ReplicateTTS:
             raise ValueError(
                 "REPLICATE_API_TOKEN not found. Please set it in your .env file."
             )
+        self._session = self._create_session()
 
         try:
             import replicate
@@ -31,6 +36,21 @@ class ReplicateTTS:
                 "replicate package not installed. Run: pip install replicate"
             )
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled session that retries transient download failures."""
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
+
     def generate_audio(
         self,
         text: str,
@@ -66,20 +86,25 @@ class ReplicateTTS:
 
     def _download_audio(self, url: str, output_path: str) -> None:
         """Download audio file from URL."""
+        # Ensure output directory exists
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = output_file.with_name(output_file.name + ".part")
+
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+            with self._session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
 
-            # Ensure output directory exists
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+                # Stream to disk in 1 MiB copies; a failed download never
+                # leaves a truncated file
+                response.raw.decode_content = True
+                with open(partial_file, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
-            # Write audio data
-            with open(output_file, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            partial_file.replace(output_file)
 
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            partial_file.unlink(missing_ok=True)
             raise Exception(f"Failed to download audio: {e}")
 
     def get_available_voices(self) -> list:
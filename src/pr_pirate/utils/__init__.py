@@ -1,3 +1,4 @@
 from .database import DatabaseManager
+from .http_cache import ETagCache
 
-__all__ = ["DatabaseManager"]
+__all__ = ["DatabaseManager", "ETagCache"]
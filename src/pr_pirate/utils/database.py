@@ -1,5 +1,9 @@
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
 from sqlalchemy import (
     create_engine,
     Column,
@@ -7,10 +11,16 @@ from sqlalchemy import (
     String,
     DateTime,
     Boolean,
+    Index,
     Float,
     Text,
     JSON,
+    LargeBinary,
+    event,
+    select,
+    tuple_,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -69,10 +79,13 @@ class IssueDB(Base):
     repo_full_name = Column(String, nullable=False)
 
     # Processing metadata
-    status = Column(String, default="discovered")
+    status = Column(String, default="discovered", index=True)
     discovered_at = Column(DateTime, nullable=False)
     processed_at = Column(DateTime)
 
+    # Also serves lookups on repo_full_name alone
+    __table_args__ = (Index("ix_issues_repo_status", "repo_full_name", "status"),)
+
 
 class AssessmentDB(Base):
     """SQLAlchemy model for assessments."""
@@ -80,9 +93,9 @@ class AssessmentDB(Base):
     __tablename__ = "assessments"
 
     id = Column(Integer, primary_key=True)
-    issue_id = Column(Integer, nullable=False)
+    issue_id = Column(Integer, nullable=False, index=True)
     issue_number = Column(Integer, nullable=False)
-    repo_full_name = Column(String, nullable=False)
+    repo_full_name = Column(String, nullable=False, index=True)
 
     # Scoring metrics
     complexity_score = Column(Float, nullable=False)
@@ -106,28 +119,208 @@ class AssessmentDB(Base):
     assessment_version = Column(String, default="1.0")
 
 
+class ResultsCacheDB(Base):
+    """SQLAlchemy model for short-lived cached discovery results."""
+
+    __tablename__ = "results_cache"
+
+    key = Column(String, primary_key=True)
+    value = Column(LargeBinary, nullable=False)
+    expires_at = Column(Integer, nullable=False)
+
+
+class HttpCacheDB(Base):
+    """SQLAlchemy model for conditional-request (ETag) cache entries."""
+
+    __tablename__ = "http_cache"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String)
+    last_modified = Column(String)
+    body = Column(LargeBinary, nullable=False)
+    fetched_at = Column(Integer, nullable=False)
+
+
+class AssessmentCacheDB(Base):
+    """SQLAlchemy model for cached LLM assessments of unchanged issues."""
+
+    __tablename__ = "assessment_cache"
+
+    issue_id = Column(Integer, primary_key=True)
+    updated_at = Column(Integer, primary_key=True)
+    model = Column(String, primary_key=True)
+    prompt_sha = Column(LargeBinary, primary_key=True)
+    result_json = Column(LargeBinary, nullable=False)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSON column value with orjson."""
+    return orjson.dumps(value).decode()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL, relaxed fsync and larger caches on each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 64 MiB page cache and 256 MiB of memory-mapped reads
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 class DatabaseManager:
-    """Database connection and session management."""
+    """Database connection and session management.
+
+    The engine is created lazily, so constructing a manager on a run that
+    never touches the database costs no file or connection setup.
+    """
 
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
             db_path = Path("data/pr_pirate.db")
 
-        # Ensure directory exists
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._engine = None
+        self._session_factory = None
+        self._init_lock = threading.Lock()
 
-        self.engine = create_engine(f"sqlite:///{db_path}")
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
-        )
+    @property
+    def engine(self):
+        """Create the engine and tables on first use."""
+        # Worker threads may hit the database first, so guard creation
+        with self._init_lock:
+            if self._engine is None:
+                # Ensure directory exists
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # orjson handles every JSON column (labels, skills, topics)
+                engine = create_engine(
+                    f"sqlite:///{self.db_path}",
+                    json_serializer=_json_dumps,
+                    json_deserializer=orjson.loads,
+                )
+                event.listen(engine, "connect", _set_sqlite_pragmas)
 
-        # Create tables
-        Base.metadata.create_all(bind=self.engine)  # type: ignore
+                # Create tables, then any indexes added since an existing
+                # database was first created
+                Base.metadata.create_all(bind=engine)  # type: ignore
+                for table in Base.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(bind=engine, checkfirst=True)
+                self._engine = engine
+
+        return self._engine
+
+    @property
+    def SessionLocal(self):
+        """Session factory bound to the lazily created engine."""
+        if self._session_factory is None:
+            # Rows are read out inside the session, so nothing needs
+            # reloading after commit
+            self._session_factory = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=self.engine,
+            )
+        return self._session_factory
 
     def get_session(self):
         """Get database session."""
         return self.SessionLocal()
 
+    def get_cached_result(self, key: str) -> Optional[bytes]:
+        """Return a cached result payload if present and not expired."""
+        with self.get_session() as session:
+            row = session.get(ResultsCacheDB, key)
+            if row is None or row.expires_at <= time.time():
+                return None
+            return row.value
+
+    def put_cached_result(self, key: str, value: bytes, ttl: int = 300) -> None:
+        """Store a result payload that expires after ttl seconds."""
+        with self.get_session() as session:
+            session.merge(
+                ResultsCacheDB(key=key, value=value, expires_at=int(time.time()) + ttl)
+            )
+            session.commit()
+
+    def get_http_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached validators and raw body for a request key."""
+        with self.get_session() as session:
+            row = session.get(HttpCacheDB, url)
+            if row is None:
+                return None
+            return {
+                "etag": row.etag,
+                "last_modified": row.last_modified,
+                "body": row.body,
+            }
+
+    def put_http_cache(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a raw response body with its validators."""
+        values = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "fetched_at": int(time.time()),
+        }
+        # Upsert, since parallel fetches may race to store the same URL
+        statement = (
+            sqlite_insert(HttpCacheDB)
+            .values(url=url, **values)
+            .on_conflict_do_update(index_elements=["url"], set_=values)
+        )
+        with self.get_session() as session:
+            session.execute(statement)
+            session.commit()
+
+    def get_cached_assessments(
+        self, keys: Iterable[Tuple[int, int, str, bytes]]
+    ) -> Dict[Tuple[int, int, str, bytes], bytes]:
+        """Return cached assessment payloads for (issue_id, updated_at, model, prompt_sha) keys."""
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        # One row-value IN query instead of a lookup per issue
+        key_columns = tuple_(
+            AssessmentCacheDB.issue_id,
+            AssessmentCacheDB.updated_at,
+            AssessmentCacheDB.model,
+            AssessmentCacheDB.prompt_sha,
+        )
+        statement = select(AssessmentCacheDB).where(key_columns.in_(keys))
+        with self.get_session() as session:
+            return {
+                (
+                    row.issue_id,
+                    row.updated_at,
+                    row.model,
+                    row.prompt_sha,
+                ): row.result_json
+                for row in session.scalars(statement)
+            }
+
+    def put_cached_assessments(self, rows: List[Dict[str, Any]]) -> None:
+        """Store assessment payloads in a single executemany transaction."""
+        if not rows:
+            return
+
+        statement = sqlite_insert(AssessmentCacheDB).on_conflict_do_nothing()
+        with self.get_session() as session:
+            session.execute(statement, rows)
+            session.commit()
+
     def close(self):
         """Close database connection."""
-        self.engine.dispose()  # type: ignore
+        if self._engine is not None:
+            self._engine.dispose()  # type: ignore
@@ -0,0 +1,106 @@
+"""SQLite-backed ETag cache for conditional GitHub API requests."""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+from .database import DatabaseManager
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age=(\d+)")
+
+
+def parse_max_age(cache_control: Optional[str]) -> int:
+    """Seconds a response may be reused without revalidation (0 if none)."""
+    if not cache_control or "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+class ETagCache:
+    """Stores response bodies with their validators for If-None-Match replays.
+
+    Entries seen during this run are also kept in memory, so repeated
+    requests skip SQLite and, while still fresh per Cache-Control, the
+    network entirely.
+    """
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        self.db_manager = db_manager or DatabaseManager()
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry (etag, last_modified, body) for a key."""
+        try:
+            with self._lock:
+                entry = self._memory.get(key)
+            if entry is None:
+                entry = self.db_manager.get_http_cache(key)
+                if entry is None:
+                    return None
+                entry["expires_at"] = 0.0
+                with self._lock:
+                    self._memory.setdefault(key, entry)
+
+            # Parse per call so callers never share a mutable body
+            return {**entry, "body": orjson.loads(entry["body"])}
+        except Exception:
+            # A broken cache only costs a full fetch
+            return None
+
+    @staticmethod
+    def is_fresh(entry: Optional[Dict[str, Any]]) -> bool:
+        """Whether an entry is still within its Cache-Control max-age."""
+        return bool(entry) and entry.get("expires_at", 0.0) > time.monotonic()
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build conditional request headers from a cached entry."""
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        max_age: int = 0,
+    ) -> None:
+        """Store a raw response body with its validators."""
+        if not etag and not last_modified and not max_age:
+            return
+
+        with self._lock:
+            self._memory[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+                "expires_at": time.monotonic() + max_age,
+            }
+
+        if not etag and not last_modified:
+            return
+
+        try:
+            self.db_manager.put_http_cache(key, body, etag, last_modified)
+        except Exception:
+            # Failing to cache must not fail the request
+            pass
+
+    def refresh(self, key: str, max_age: int) -> None:
+        """Extend an entry's freshness after a 304 revalidation."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                entry["expires_at"] = time.monotonic() + max_age
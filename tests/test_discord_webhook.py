@@ -0,0 +1,104 @@
+"""Tests for Discord webhook uploads."""
+
+import requests
+
+from pr_pirate.notifications.discord_webhook import DiscordNotifier, _MultipartBody
+
+
+def _response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    return response
+
+
+def test_multipart_body_sends_content_length_without_chunking(tmp_path):
+    audio = tmp_path / "summary.wav"
+    audio.write_bytes(b"RIFF" + bytes(200_000))
+
+    body = _MultipartBody({"content": "hi"}, "file", str(audio))
+    prepared = requests.Request(
+        "POST",
+        "https://discord.test/webhook",
+        data=body,
+        headers={"Content-Type": body.content_type},
+    ).prepare()
+
+    assert prepared.headers["Content-Length"] == str(len(body))
+    assert "Transfer-Encoding" not in prepared.headers
+
+    payload = body.read()
+    assert len(payload) == len(body)
+    assert b'name="content"\r\n\r\nhi\r\n' in payload
+    assert b'filename="summary.wav"' in payload
+    assert audio.read_bytes() in payload
+    body.close()
+
+
+def test_multipart_body_reads_in_bounded_chunks(tmp_path):
+    audio = tmp_path / "summary.wav"
+    audio.write_bytes(bytes(range(256)) * 100)
+
+    body = _MultipartBody({}, "file", str(audio))
+    chunks = []
+    while chunk := body.read(1000):
+        assert len(chunk) <= 1000
+        chunks.append(chunk)
+
+    assert sum(map(len, chunks)) == len(body)
+    assert audio.read_bytes() in b"".join(chunks)
+
+
+def test_send_file_posts_prepared_request_with_length(tmp_path, monkeypatch):
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/webhook")
+    audio = tmp_path / "summary.wav"
+    audio.write_bytes(bytes(5000))
+
+    notifier = DiscordNotifier()
+    sent = []
+
+    def fake_post(url, **kwargs):
+        prepared = notifier._session.prepare_request(
+            requests.Request(
+                "POST", url, data=kwargs["data"], headers=kwargs["headers"]
+            )
+        )
+        sent.append((prepared.headers, kwargs["data"].read()))
+        return _response(204)
+
+    monkeypatch.setattr(notifier._session, "post", fake_post)
+    assert notifier.send_file(str(audio), "ready").result()
+
+    ((headers, payload),) = sent
+    assert headers["Content-Length"] == str(len(payload))
+    assert "Transfer-Encoding" not in headers
+    assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+
+
+def test_send_file_reports_failed_upload(tmp_path, monkeypatch):
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/webhook")
+    audio = tmp_path / "summary.wav"
+    audio.write_bytes(bytes(100))
+
+    notifier = DiscordNotifier()
+    monkeypatch.setattr(notifier._session, "post", lambda url, **kwargs: _response(400))
+
+    assert notifier.send_file(str(audio)).result() is False
+
+
+def test_notifier_accepts_posts_after_flush(monkeypatch):
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/webhook")
+    notifier = DiscordNotifier()
+    sent = []
+    monkeypatch.setattr(
+        notifier._session,
+        "post",
+        lambda url, **kwargs: sent.append(kwargs["data"]) or _response(204),
+    )
+
+    notifier.send_message("first")
+    notifier.flush()
+    notifier.send_message("second")
+    notifier.flush()
+
+    assert len(sent) == 2
@@ -0,0 +1,144 @@
+"""Tests for the ETag/max-age HTTP cache and its use in GitHubClient._get."""
+
+import orjson
+import pytest
+import requests
+
+from pr_pirate.discovery.github_client import GitHubClient
+from pr_pirate.utils.database import DatabaseManager
+from pr_pirate.utils.http_cache import ETagCache, parse_max_age
+
+
+def _response(status_code: int, body=None, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = orjson.dumps(body) if body is not None else b""
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Replays scripted responses and records the headers of each GET."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(tmp_path / "cache.db")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def client(db_manager):
+    return GitHubClient("token", db_manager=db_manager, probe_rate_limits=False)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, 0),
+        ("max-age=60", 60),
+        ("private, max-age=60, s-maxage=60", 60),
+        ("public, s-maxage=60", 0),
+        ("no-cache, max-age=60", 0),
+        ("no-store", 0),
+    ],
+)
+def test_parse_max_age(header, expected):
+    assert parse_max_age(header) == expected
+
+
+def test_put_without_validators_or_max_age_is_not_cached(db_manager):
+    cache = ETagCache(db_manager)
+    cache.put("key", b"[1]")
+
+    assert cache.get("key") is None
+
+
+def test_entries_persist_across_cache_instances_but_not_freshness(db_manager):
+    ETagCache(db_manager).put("key", b'{"a": 1}', etag='"v1"', max_age=60)
+
+    entry = ETagCache(db_manager).get("key")
+
+    assert entry["body"] == {"a": 1}
+    assert not ETagCache.is_fresh(entry)
+    assert ETagCache(db_manager).conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+
+def test_get_returns_independent_bodies(db_manager):
+    cache = ETagCache(db_manager)
+    cache.put("key", b'{"a": 1}', etag='"v1"')
+
+    cache.get("key")["body"]["a"] = 2
+
+    assert cache.get("key")["body"] == {"a": 1}
+
+
+def test_304_replays_cached_body(client):
+    session = FakeSession(
+        [
+            _response(200, {"id": 1}, {"ETag": '"v1"'}),
+            _response(304, headers={"ETag": '"v1"'}),
+        ]
+    )
+    client.session = session
+
+    assert client._get("/repos/o/r") == {"id": 1}
+    assert client._get("/repos/o/r") == {"id": 1}
+
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+def test_fresh_entry_skips_the_network(client):
+    session = FakeSession(
+        [_response(200, {"id": 1}, {"ETag": '"v1"', "Cache-Control": "max-age=60"})]
+    )
+    client.session = session
+
+    assert client._get("/repos/o/r") == {"id": 1}
+    assert client._get("/repos/o/r") == {"id": 1}
+
+    assert len(session.sent_headers) == 1
+
+
+def test_304_extends_freshness(client):
+    session = FakeSession(
+        [
+            _response(200, {"id": 1}, {"ETag": '"v1"'}),
+            _response(304, headers={"Cache-Control": "max-age=60"}),
+        ]
+    )
+    client.session = session
+
+    client._get("/repos/o/r")
+    client._get("/repos/o/r")
+    # Revalidated with a max-age, so the third call is served locally
+    assert client._get("/repos/o/r") == {"id": 1}
+
+    assert len(session.sent_headers) == 2
+
+
+def test_changed_resource_replaces_cached_body(client):
+    session = FakeSession(
+        [
+            _response(200, {"id": 1}, {"ETag": '"v1"'}),
+            _response(200, {"id": 2}, {"ETag": '"v2"'}),
+            _response(304),
+        ]
+    )
+    client.session = session
+
+    client._get("/repos/o/r")
+    assert client._get("/repos/o/r") == {"id": 2}
+    assert client._get("/repos/o/r") == {"id": 2}
+
+    assert session.sent_headers[2]["If-None-Match"] == '"v2"'
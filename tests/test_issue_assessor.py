@@ -0,0 +1,146 @@
+"""Tests for batched LLM assessment parsing and batching."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from pr_pirate.llm.issue_assessor import IssueAssessor
+from pr_pirate.models import Issue
+
+SCORES = {
+    "complexity_score": 3,
+    "clarity_score": 8,
+    "scope_score": 3,
+    "feasibility_score": 8,
+    "overall_score": 7,
+    "is_doable": True,
+    "confidence": 0.8,
+    "reasoning": "Small, well-described fix.",
+    "estimated_effort_hours": 2,
+    "required_skills": ["python"],
+    "potential_risks": [],
+}
+
+
+def _issue(issue_id: int, number: int = 1, repo: str = "o/r", body: str = "b") -> Issue:
+    now = datetime.now(timezone.utc)
+    return Issue(
+        id=issue_id,
+        number=number,
+        title=f"Issue {issue_id}",
+        body=body,
+        html_url=f"https://github.com/{repo}/issues/{number}",
+        state="open",
+        comments=0,
+        created_at=now,
+        updated_at=now,
+        author_association="NONE",
+        repo_id=1,
+        repo_full_name=repo,
+    )
+
+
+@pytest.fixture
+def assessor():
+    # Skip client setup; requests are faked per test
+    assessor = IssueAssessor.__new__(IssueAssessor)
+    assessor.anthropic_client = object()
+    assessor.openai_client = None
+    assessor.db_manager = None
+    return assessor
+
+
+def test_parse_matches_items_by_position(assessor):
+    # Same issue number in two repositories: only the index tells them apart
+    issues = [_issue(10, number=1, repo="a/x"), _issue(20, number=1, repo="b/y")]
+    items = [
+        {"index": 2, **SCORES, "overall_score": 4},
+        {"index": 1, **SCORES, "overall_score": 9},
+    ]
+
+    assessments, missing = assessor._parse_assessments(issues, items)
+
+    assert missing == []
+    assert [(a.issue_id, a.overall_score) for a in assessments] == [(10, 9), (20, 4)]
+    assert assessments[1].repo_full_name == "b/y"
+
+
+def test_parse_reports_missing_indices(assessor):
+    issues = [_issue(1), _issue(2), _issue(3)]
+    items = [{"index": 1, **SCORES}, {"index": 3, **SCORES}]
+
+    assessments, missing = assessor._parse_assessments(issues, items)
+
+    assert [a.issue_id for a in assessments] == [1, 3]
+    assert [issue.id for issue in missing] == [2]
+
+
+def test_parse_ignores_indices_outside_the_batch(assessor):
+    issues = [_issue(1)]
+    items = [{"index": 0, **SCORES}, {"index": 7, **SCORES}]
+
+    assessments, missing = assessor._parse_assessments(issues, items)
+
+    assert assessments == []
+    assert [issue.id for issue in missing] == [1]
+
+
+def test_parse_treats_invalid_entries_as_missing(assessor):
+    issues = [_issue(1), _issue(2), _issue(3)]
+    items = [
+        {"index": 1, **SCORES, "complexity_score": 42},  # outside 1-10
+        {"index": 2, "overall_score": 5},  # incomplete
+        {"index": 3, **SCORES},
+    ]
+
+    assessments, missing = assessor._parse_assessments(issues, items)
+
+    assert [a.issue_id for a in assessments] == [3]
+    assert [issue.id for issue in missing] == [1, 2]
+
+
+def test_batch_retries_missing_issues_individually(assessor):
+    issues = [_issue(1), _issue(2), _issue(3)]
+    calls = []
+
+    def fake_request(prompt, max_tokens):
+        count = prompt.count("Repository:")
+        calls.append(count)
+        if count == 1:
+            return [{"index": 1, **SCORES}]
+        # The batch answer skips the second issue
+        return [{"index": 1, **SCORES}, {"index": 3, **SCORES}]
+
+    assessor._request_assessments = fake_request
+
+    assessments = assessor._assess_issue_batch(issues)
+
+    assert sorted(a.issue_id for a in assessments) == [1, 2, 3]
+    assert calls == [3, 1]
+
+
+def test_batch_failure_falls_back_to_single_issues(assessor):
+    issues = [_issue(1), _issue(2)]
+
+    def fake_request(prompt, max_tokens):
+        if prompt.count("Repository:") > 1:
+            raise RuntimeError("malformed batch response")
+        return [{"index": 1, **SCORES}]
+
+    assessor._request_assessments = fake_request
+
+    assessments = assessor._assess_issue_batch(issues)
+
+    assert sorted(a.issue_id for a in assessments) == [1, 2]
+
+
+def test_batches_are_bounded_by_count_and_body_budget(assessor):
+    small = [_issue(i) for i in range(7)]
+    assert [len(b) for b in assessor._batch_issues(small)] == [5, 2]
+
+    # Descriptions count at their 500-character preview length
+    assessor.BATCH_BODY_BUDGET = 1200
+    large = [_issue(i, body="x" * 2000) for i in range(5)]
+    batches = assessor._batch_issues(large)
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [issue.id for batch in batches for issue in batch] == list(range(5))
@@ -0,0 +1,125 @@
+"""Tests for the header-driven GitHub rate limiter."""
+
+import time
+
+import pytest
+
+from pr_pirate.discovery.github_client import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(time, "sleep", fake.sleep)
+    return fake
+
+
+def test_unknown_budget_does_not_stall(clock):
+    limiter = RateLimiter()
+
+    with limiter.acquire("core"):
+        pass
+
+    assert clock.sleeps == []
+    assert limiter.remaining("core") is None
+
+
+def test_acquire_draws_from_reported_budget(clock):
+    limiter = RateLimiter()
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Resource": "core",
+            "X-RateLimit-Remaining": "500",
+            "X-RateLimit-Reset": str(time.time() + 60),
+        }
+    )
+
+    with limiter.acquire("core"):
+        pass
+
+    assert limiter.remaining("core") == 499
+    assert clock.sleeps == []
+
+
+def test_acquire_stalls_until_reset_at_reserve(clock):
+    limiter = RateLimiter({"search": 2})
+    limiter.update("search", remaining=2, reset=time.time() + 30)
+
+    with limiter.acquire("search"):
+        pass
+
+    assert len(clock.sleeps) == 1
+    assert clock.sleeps[0] == pytest.approx(31, abs=1)
+
+
+def test_retry_after_stalls_for_the_given_seconds(clock):
+    limiter = RateLimiter()
+    limiter.update_from_headers({"Retry-After": "10"}, "graphql")
+
+    with limiter.acquire("graphql"):
+        pass
+
+    assert clock.sleeps == [pytest.approx(11)]
+
+
+def test_refresh_restores_budget_without_stalling(clock):
+    calls = []
+
+    def refresh():
+        calls.append(True)
+        limiter.update("core", remaining=5000, reset=time.time() + 3600)
+
+    limiter = RateLimiter(refresh=refresh)
+    limiter.update("core", remaining=50, reset=time.time() + 600)
+
+    with limiter.acquire("core"):
+        pass
+
+    assert calls == [True]
+    assert clock.sleeps == []
+    assert limiter.remaining("core") == 4999
+
+
+def test_refresh_runs_once_before_stalling(clock):
+    calls = []
+
+    def refresh():
+        calls.append(True)
+
+    limiter = RateLimiter(refresh=refresh)
+    limiter.update("core", remaining=0, reset=time.time() + 20)
+
+    with limiter.acquire("core"):
+        pass
+
+    assert calls == [True]
+    assert len(clock.sleeps) == 1
+
+
+def test_failed_refresh_falls_back_to_waiting(clock):
+    def refresh():
+        raise RuntimeError("network down")
+
+    limiter = RateLimiter(refresh=refresh)
+    limiter.update("core", remaining=0, reset=time.time() + 20)
+
+    with limiter.acquire("core"):
+        pass
+
+    assert len(clock.sleeps) == 1
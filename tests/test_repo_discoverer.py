@@ -0,0 +1,62 @@
+"""Tests for the REST topic-search fallback and its page usage."""
+
+import orjson
+import requests
+
+from pr_pirate.discovery.github_client import GitHubClient
+from pr_pirate.discovery.repo_discoverer import RepositoryDiscoverer
+
+
+def _repo(repo_id: int) -> dict:
+    return {
+        "id": repo_id,
+        "name": f"r{repo_id}",
+        "full_name": f"o/r{repo_id}",
+        "html_url": f"https://github.com/o/r{repo_id}",
+        "stargazers_count": 100,
+        "forks_count": 10,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-06-01T00:00:00Z",
+        "open_issues_count": 5,
+    }
+
+
+class PagedSession:
+    """Serves full pages of search results and records the pages requested."""
+
+    def __init__(self):
+        self.pages = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        page = params["page"]
+        self.pages.append(page)
+        start = (page - 1) * params["per_page"]
+        items = [_repo(i) for i in range(start, start + params["per_page"])]
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps({"items": items})
+        return response
+
+
+def test_topic_search_requests_a_single_page():
+    client = GitHubClient("token", use_cache=False, probe_rate_limits=False)
+    session = PagedSession()
+    client.session = session
+
+    discoverer = RepositoryDiscoverer(client)
+    repos = discoverer._search_single_topic("llm", "topic:llm")
+
+    assert len(repos) == RepositoryDiscoverer.SEARCH_PAGE_SIZE == 100
+    assert session.pages == [1]
+
+
+def test_search_pages_only_as_far_as_needed():
+    client = GitHubClient("token", use_cache=False, probe_rate_limits=False)
+    session = PagedSession()
+    client.session = session
+
+    repos = client.search_repositories("topic:llm", per_page=150)
+
+    assert [repo["id"] for repo in repos] == list(range(150))
+    assert session.pages == [1, 2]